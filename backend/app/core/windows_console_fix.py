@@ -16,6 +16,10 @@ if sys.platform == "win32":
         """
         A wrapper around stdout/stderr that handles encoding errors gracefully.
         Replaces characters that can't be encoded with '?' instead of crashing.
+
+        Only used for streams that can't be reconfigured in place (see
+        _make_safe); regular text streams are switched to UTF-8 with
+        errors='replace' so encoding stays in C with no retry per write.
         """
         def __init__(self, stream, encoding='utf-8'):
             self._stream = stream
@@ -58,16 +62,26 @@ if sys.platform == "win32":
             # Delegate any other attributes to the underlying stream
             return getattr(self._stream, name)
 
-    # Wrap stdout and stderr with safe writers
-    if not isinstance(sys.stdout, SafeConsoleWriter):
-        sys.stdout = SafeConsoleWriter(sys.stdout)
-    if not isinstance(sys.stderr, SafeConsoleWriter):
-        sys.stderr = SafeConsoleWriter(sys.stderr)
+    def _make_safe(stream):
+        """Make a stream encode as UTF-8 with errors='replace', wrapping it only if needed."""
+        if stream is None or isinstance(stream, SafeConsoleWriter):
+            return stream
+        reconfigure = getattr(stream, 'reconfigure', None)
+        if reconfigure is not None:
+            try:
+                reconfigure(encoding='utf-8', errors='replace')
+                return stream
+            except (ValueError, io.UnsupportedOperation):
+                pass
+        return SafeConsoleWriter(stream)
+
+    # Make stdout and stderr safe
+    sys.stdout = _make_safe(sys.stdout)
+    sys.stderr = _make_safe(sys.stderr)
 
-    # Also wrap __stdout__ and __stderr__ which some libraries access directly
-    if hasattr(sys, '__stdout__') and sys.__stdout__ is not None:
-        if not isinstance(sys.__stdout__, SafeConsoleWriter):
-            sys.__stdout__ = SafeConsoleWriter(sys.__stdout__)
-    if hasattr(sys, '__stderr__') and sys.__stderr__ is not None:
-        if not isinstance(sys.__stderr__, SafeConsoleWriter):
-            sys.__stderr__ = SafeConsoleWriter(sys.__stderr__)
+    # Also cover __stdout__ and __stderr__ which some libraries access directly
+    # (usually the same objects, already reconfigured above)
+    if hasattr(sys, '__stdout__'):
+        sys.__stdout__ = _make_safe(sys.__stdout__)
+    if hasattr(sys, '__stderr__'):
+        sys.__stderr__ = _make_safe(sys.__stderr__)
@@ -67,8 +67,12 @@ class WorkflowParser:
 
         tasks_list = []
 
-        # Sort topologically to ensure upstream tasks are created first
-        sorted_node_ids = self._topological_sort()
+        # Sort topologically to ensure upstream tasks are created first,
+        # grouped into levels (longest path from a root) so that tasks
+        # with no dependency on each other sit next to each other
+        levels = self._levels(self._topological_sort(), upstream_map)
+        sorted_node_ids = sorted(levels, key=levels.get)
+        async_node_ids = self._parallel_node_ids(levels)
 
         for node_id in sorted_node_ids:
             if node_id in self.agents_map:
@@ -124,7 +128,8 @@ class WorkflowParser:
                     description=task_description,
                     agent=agent,
                     expected_output="Detailed analysis and execution results.",
-                    context=context_tasks if context_tasks else None
+                    context=context_tasks if context_tasks else None,
+                    async_execution=node_id in async_node_ids
                 )
                 tasks_list.append(task)
                 self.tasks_map[node_id] = task
@@ -156,7 +161,7 @@ class WorkflowParser:
         from langchain_google_genai import ChatGoogleGenerativeAI
         from langchain_anthropic import ChatAnthropic
         from app.core.context_loader import ContextLoader
-        from app.tools.script_execution_tool import ScriptRegistry
+        from app.tools.script_execution_tool import get_script_registry
 
         # Load TELOS context
         loader = ContextLoader()
@@ -206,7 +211,7 @@ class WorkflowParser:
             tools.extend(cached_tool)
 
         # Load script tools as fallback (from ~/.pai/skills/)
-        script_tool_registry = ScriptRegistry()
+        script_tool_registry = get_script_registry()
         script_tools = script_tool_registry.get_tools()
         tools.extend(script_tools)
 
@@ -309,6 +314,42 @@ class WorkflowParser:
                 temperature=0.7
             )
 
+    def _levels(self, sorted_node_ids: List[str], upstream_map: Dict[str, List[str]]) -> Dict[str, int]:
+        """
+        Level of each node: 0 for roots, else one more than its deepest
+        upstream node. Nodes on the same level never depend on each other.
+        Returned in the order given, so ties keep topological order.
+        """
+        levels: Dict[str, int] = {}
+        for node_id in sorted_node_ids:
+            levels[node_id] = 1 + max(
+                (levels.get(uid, -1) for uid in upstream_map.get(node_id, [])),
+                default=-1,
+            )
+        return levels
+
+    def _parallel_node_ids(self, levels: Dict[str, int]) -> set:
+        """
+        Agent nodes whose tasks can run concurrently (async_execution).
+
+        In a sequential crew, async tasks start in the background and the
+        next synchronous task waits for all of them before it runs. A level
+        with several agents can therefore run in parallel when the next
+        level holds a single agent, which then acts as the join point.
+        The final level always stays synchronous.
+        """
+        by_level: Dict[int, List[str]] = {}
+        for node_id, level in levels.items():
+            if node_id in self.agents_map:
+                by_level.setdefault(level, []).append(node_id)
+
+        ordered = [by_level[level] for level in sorted(by_level)]
+        parallel = set()
+        for group, next_group in zip(ordered, ordered[1:]):
+            if len(group) > 1 and len(next_group) == 1:
+                parallel.update(group)
+        return parallel
+
     def _topological_sort(self) -> List[str]:
         """
         Determines execution order based on Edges using Kahn's Algorithm.
@@ -4,8 +4,17 @@ import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 
+# orjson is optional; when installed, JSON responses are encoded with it
+# (ORJSONResponse imports fine without it and only fails when rendering)
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 # Fix Windows console encoding for emoji support
 if sys.platform == "win32":
     try:
@@ -75,6 +84,7 @@ app = FastAPI(
     title="Brain Trust v3.0 API - Legion",
     version="3.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 # CORS (Allow Frontend to connect)
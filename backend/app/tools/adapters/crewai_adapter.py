@@ -10,7 +10,7 @@ This adapter handles:
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, Type, TYPE_CHECKING
 
 from pydantic import BaseModel, Field, create_model
 from crewai.tools import BaseTool
@@ -22,6 +22,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Args models keyed by (tool_id, parameter signature); re-converting an
+# unchanged tool after a rescan reuses the model instead of rebuilding it
+_ARGS_SCHEMA_CACHE: Dict[Tuple[Any, ...], Type[BaseModel]] = {}
+
 
 class CrewAIAdapter:
     """
@@ -129,6 +133,17 @@ class CrewAIAdapter:
         This converts our ToolParameter list into a Pydantic BaseModel
         that CrewAI can use for argument validation.
         """
+        key = (tool.tool_id,) + tuple(
+            (p.name, p.type, p.required, repr(p.default), p.description)
+            for p in tool.parameters
+        )
+        schema = _ARGS_SCHEMA_CACHE.get(key)
+        if schema is None:
+            schema = _ARGS_SCHEMA_CACHE[key] = self._build_args_schema(tool)
+        return schema
+
+    def _build_args_schema(self, tool: ToolDefinition) -> Type[BaseModel]:
+        """Build the args model for _create_args_schema."""
         if not tool.parameters:
             # No parameters - return empty schema
             return create_model(f"{tool.tool_id}_Args")
@@ -196,6 +211,10 @@ class CrewAIAdapter:
 
         return tools
 
+    def invalidate(self, tool_id: str) -> None:
+        """Drop the cached conversion for a single tool."""
+        self._converted_cache.pop(tool_id, None)
+
     def clear_cache(self) -> None:
         """Clear the converted tool cache."""
         self._converted_cache.clear()
@@ -2,8 +2,9 @@ from typing import List, Type
 from pydantic import BaseModel, Field
 from crewai.tools import BaseTool
 import os
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+
+from app.tools import google_clients
+from app.tools.google_exec import execute_with_retry
 
 # Scopes
 SCOPES = ['https://www.googleapis.com/auth/drive', 'https://www.googleapis.com/auth/documents']
@@ -24,25 +25,17 @@ FOLDER_IDS = {
     'world': '1Iik6DK8RDsLw-nBRTwaaJ3A8c3dP1RZP',          # World
 }
 
+# Extensions read as plain text regardless of their reported mime type
+TEXT_FILE_EXTENSIONS = frozenset({
+    '.txt', '.md', '.json', '.yaml', '.yml', '.py', '.js', '.ts', '.css', '.html', '.xml', '.csv',
+})
+
 class DriveAuth:
     """Helper to authenticate with Google Drive"""
     @staticmethod
     def authenticate():
-        # First try environment variable (absolute path)
-        creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-        
-        # If relative or not set, resolve relative to this file
-        if not creds_path or not os.path.isabs(creds_path):
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            creds_path = os.path.join(base_dir, "credentials.json")
-        
-        if not os.path.exists(creds_path):
-            raise FileNotFoundError(f"Service account key not found at: {creds_path}")
-        
-        creds = service_account.Credentials.from_service_account_file(
-            creds_path, scopes=SCOPES
-        )
-        return creds
+        # Loaded once per process and shared with the cached clients below
+        return google_clients.get_credentials(tuple(SCOPES))
 
 class DriveListInput(BaseModel):
     folder_id: str = Field(description="The ID of the folder to list files from. Use 'root' or 'all' to list all accessible files and folders.")
@@ -54,8 +47,7 @@ class DriveListTool(BaseTool):
 
     def _run(self, folder_id: str = 'root') -> str:
         try:
-            creds = DriveAuth.authenticate()
-            service = build('drive', 'v3', credentials=creds)
+            service = google_clients.drive_service(tuple(SCOPES))
             
             # Collect all items across all pages
             items = []
@@ -71,16 +63,16 @@ class DriveListTool(BaseTool):
             
             # Paginate through all results
             while True:
-                results = service.files().list(
+                results = execute_with_retry(service.files().list(
                     q=query,
                     corpora='drive',
                     driveId=SHARED_DRIVE_ID,
                     includeItemsFromAllDrives=True,
                     supportsAllDrives=True,
                     pageSize=100,  # Increased for efficiency
-                    fields="nextPageToken, files(id, name, mimeType, parents)",
+                    fields="nextPageToken, files(id, name, mimeType)",
                     pageToken=page_token
-                ).execute()
+                ))
                 
                 items.extend(results.get('files', []))
                 page_token = results.get('nextPageToken')
@@ -113,38 +105,57 @@ class DriveListTool(BaseTool):
 
 class DriveReadInput(BaseModel):
     file_id: str = Field(description="The ID of the Google Doc to read.")
+    max_chars: int = Field(default=0, description="Return only the first this many characters, inline (0 reads the whole document).")
 
 class DriveReadTool(BaseTool):
     name: str = "Google Doc Reader"
     description: str = "Reads the text content of a Google Doc. For large documents, returns a summary with a cache path for full content access."
     args_schema: Type[BaseModel] = DriveReadInput
 
-    def _run(self, file_id: str) -> str:
+    def _run(self, file_id: str, max_chars: int = 0) -> str:
         try:
             from app.core.context_cache import cache_content
 
-            creds = DriveAuth.authenticate()
-            drive_service = build('drive', 'v3', credentials=creds)
-            docs_service = build('docs', 'v1', credentials=creds)
+            drive_service = google_clients.drive_service(tuple(SCOPES))
+            docs_service = google_clients.docs_service(tuple(SCOPES))
 
             # Get file metadata for caching
-            file_meta = drive_service.files().get(
+            file_meta = execute_with_retry(drive_service.files().get(
                 fileId=file_id,
                 fields="name,mimeType",
                 supportsAllDrives=True
-            ).execute()
+            ))
             file_name = file_meta.get('name', 'Unknown Document')
 
-            document = docs_service.documents().get(documentId=file_id).execute()
+            if max_chars > 0:
+                # The field mask drops styles and structure, but the Docs API
+                # still returns every text run in the body; stopping early
+                # only saves joining the rest.
+                document = execute_with_retry(docs_service.documents().get(
+                    documentId=file_id,
+                    fields='body(content(paragraph(elements(textRun(content)))))'
+                ))
+                runs, length = [], 0
+                for run in google_clients.iter_text_runs(document.get('body', {}).get('content', [])):
+                    runs.append(run)
+                    length += len(run)
+                    if length > max_chars:
+                        break
+                text = "".join(runs)[:max_chars]
+
+                if not text.strip():
+                    return f"[DOC] Document '{file_name}' is empty or contains only formatting"
+
+                # A partial read is returned inline, never stored in the context
+                # cache, which is keyed by file_id and holds the full document
+                if length > max_chars:
+                    return f"[DOC] Document: {file_name}\n\n{text}\n[truncated at {max_chars:,} chars]"
+                return f"[DOC] Document: {file_name}\n\n{text}"
+
+            document = execute_with_retry(docs_service.documents().get(documentId=file_id))
 
             # Simple text extraction
-            text = ""
-            for content in document.get('body', {}).get('content', []):
-                if 'paragraph' in content:
-                    elements = content.get('paragraph', {}).get('elements', [])
-                    for elem in elements:
-                        if 'textRun' in elem:
-                            text += elem.get('textRun', {}).get('content', '')
+            text = "".join(google_clients.iter_text_runs(document.get('body', {}).get('content', [])))
 
             if not text.strip():
                 return f"[DOC] Document '{file_name}' is empty or contains only formatting"
@@ -208,9 +219,8 @@ class DriveWriteTool(BaseTool):
             from googleapiclient.http import MediaIoBaseUpload
             import io
             
-            creds = DriveAuth.authenticate()
-            docs_service = build('docs', 'v1', credentials=creds)
-            drive_service = build('drive', 'v3', credentials=creds)
+            docs_service = google_clients.docs_service(tuple(SCOPES))
+            drive_service = google_clients.drive_service(tuple(SCOPES))
             
             # Look up the folder ID from FOLDER_IDS
             target_folder = FOLDER_IDS.get(folder.lower())
@@ -229,12 +239,12 @@ class DriveWriteTool(BaseTool):
             # Uploading a file (even empty) acts differently than creating a native doc from scratch
             media = MediaIoBaseUpload(io.BytesIO(b' '), mimetype='text/plain', resumable=True)
             
-            doc = drive_service.files().create(
+            doc = execute_with_retry(drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 supportsAllDrives=True,
                 fields='id'
-            ).execute()
+            ), idempotent=False)
             
             doc_id = doc.get('id')
             
@@ -250,7 +260,7 @@ class DriveWriteTool(BaseTool):
                         }
                     }
                 ]
-                docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
+                execute_with_retry(docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}), idempotent=False)
             
             folder_display = folder.replace('_', ' ').title()
             return f"[OK] Successfully created document '{title}' in '{folder_display}' folder (ID: {doc_id})"
@@ -267,8 +277,7 @@ class WordDocExportTool(BaseTool):
 
     def _run(self, file_id: str) -> str:
         try:
-            creds = DriveAuth.authenticate()
-            drive_service = build('drive', 'v3', credentials=creds)
+            drive_service = google_clients.drive_service(tuple(SCOPES))
             
             # Export as plain text
             request = drive_service.files().export_media(
@@ -276,7 +285,7 @@ class WordDocExportTool(BaseTool):
                 mimeType='text/plain'
             )
             
-            content = request.execute()
+            content = execute_with_retry(request)
             text = content.decode('utf-8')
             
             if not text.strip():
@@ -286,7 +295,7 @@ class WordDocExportTool(BaseTool):
         except Exception as e:
             # If export fails, try getting file metadata to provide better error
             try:
-                file_metadata = drive_service.files().get(fileId=file_id, fields="name,mimeType").execute()
+                file_metadata = execute_with_retry(drive_service.files().get(fileId=file_id, fields="name,mimeType"))
                 mime_type = file_metadata.get('mimeType', 'unknown')
                 name = file_metadata.get('name', 'unknown')
                 return f"[ERROR] Cannot export file '{name}' (type: {mime_type}). Error: {str(e)}"
@@ -306,15 +315,14 @@ class PlainTextFileReadTool(BaseTool):
             from app.core.context_cache import cache_content
             import io
 
-            creds = DriveAuth.authenticate()
-            drive_service = build('drive', 'v3', credentials=creds)
+            drive_service = google_clients.drive_service(tuple(SCOPES))
 
             # Get file metadata
-            file_meta = drive_service.files().get(
+            file_meta = execute_with_retry(drive_service.files().get(
                 fileId=file_id,
-                fields="name,mimeType,size",
+                fields="name,mimeType",
                 supportsAllDrives=True
-            ).execute()
+            ))
 
             file_name = file_meta.get('name', 'Unknown')
             mime_type = file_meta.get('mimeType', 'unknown')
@@ -405,13 +413,12 @@ class FindFolderTool(BaseTool):
                     f"   Parents: {SHARED_DRIVE_ID}\n"
                 )
 
-            creds = DriveAuth.authenticate()
-            service = build('drive', 'v3', credentials=creds)
+            service = google_clients.drive_service(tuple(SCOPES))
             
             # Search for folders with this name in the Shared Drive
             query = f"name = '{folder_name}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
             
-            results = service.files().list(
+            results = execute_with_retry(service.files().list(
                 q=query,
                 corpora='drive',
                 driveId=SHARED_DRIVE_ID,
@@ -419,7 +426,7 @@ class FindFolderTool(BaseTool):
                 supportsAllDrives=True,
                 pageSize=100,
                 fields="files(id, name, parents)"
-            ).execute()
+            ))
             
             folders = results.get('files', [])
             
@@ -448,15 +455,14 @@ class UniversalFileReadTool(BaseTool):
     def _run(self, file_id: str) -> str:
         """Read any file by detecting its type and using the appropriate reader."""
         try:
-            creds = DriveAuth.authenticate()
-            drive_service = build('drive', 'v3', credentials=creds)
+            drive_service = google_clients.drive_service(tuple(SCOPES))
 
             # Get file metadata to determine type
-            file_meta = drive_service.files().get(
+            file_meta = execute_with_retry(drive_service.files().get(
                 fileId=file_id,
-                fields="name,mimeType,size",
+                fields="name,mimeType",
                 supportsAllDrives=True
-            ).execute()
+            ))
 
             file_name = file_meta.get('name', 'Unknown')
             mime_type = file_meta.get('mimeType', 'unknown')
@@ -476,14 +482,14 @@ class UniversalFileReadTool(BaseTool):
                         fileId=file_id,
                         mimeType='text/csv'
                     )
-                    content = request.execute()
+                    content = execute_with_retry(request)
                     text = content.decode('utf-8')
                     return f"[DOC] Spreadsheet '{file_name}' (exported as CSV):\n\n{text}"
                 except Exception as e:
                     return f"[ERROR] Could not export spreadsheet: {str(e)}"
 
             # Plain text files (.txt, .md, .json, .yaml, .py, etc.)
-            elif mime_type.startswith('text/') or file_name.lower().endswith(('.txt', '.md', '.json', '.yaml', '.yml', '.py', '.js', '.ts', '.css', '.html', '.xml', '.csv')):
+            elif mime_type.startswith('text/') or os.path.splitext(file_name)[1].lower() in TEXT_FILE_EXTENSIONS:
                 return PlainTextFileReadTool()._run(file_id)
 
             # PDF - try to export as text (works for Google Docs-converted PDFs)
@@ -529,22 +535,15 @@ class DocsEditTool(BaseTool):
 
     def _run(self, doc_id: str, operation: str, text: str = "", index: int = 1) -> str:
         try:
-            creds = DriveAuth.authenticate()
-            docs_service = build('docs', 'v1', credentials=creds)
+            docs_service = google_clients.docs_service(tuple(SCOPES))
             
             operation = operation.lower().strip()
             
             # READ operation
             if operation == 'read':
-                document = docs_service.documents().get(documentId=doc_id).execute()
+                document = execute_with_retry(docs_service.documents().get(documentId=doc_id))
                 content = document.get('body', {}).get('content', [])
-                
-                text_content = ""
-                for block in content:
-                    if 'paragraph' in block:
-                        for element in block['paragraph'].get('elements', []):
-                            if 'textRun' in element:
-                                text_content += element['textRun'].get('content', '')
+                text_content = "".join(google_clients.iter_text_runs(content))
                 
                 if not text_content.strip():
                     return f"[DOC] Document is empty or contains only formatting"
@@ -555,18 +554,16 @@ class DocsEditTool(BaseTool):
                 if not text:
                     return "[ERROR] Append requires 'text' parameter"
                 
-                document = docs_service.documents().get(documentId=doc_id).execute()
-                end_index = document['body']['content'][-1]['endIndex']
-                
+                # endOfSegmentLocation appends to the body without reading it first
                 requests = [
                     {
                         'insertText': {
-                            'location': {'index': end_index},
+                            'endOfSegmentLocation': {},
                             'text': text
                         }
                     }
                 ]
-                docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
+                execute_with_retry(docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}), idempotent=False)
                 return f"[OK] Appended {len(text)} characters to document"
             
             # INSERT operation - insert text at specific position
@@ -582,7 +579,7 @@ class DocsEditTool(BaseTool):
                         }
                     }
                 ]
-                docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
+                execute_with_retry(docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}), idempotent=False)
                 return f"[OK] Inserted {len(text)} characters at position {index}"
             
             # REPLACE operation - replace all content
@@ -590,7 +587,7 @@ class DocsEditTool(BaseTool):
                 if not text:
                     return "[ERROR] Replace requires 'text' parameter"
                 
-                document = docs_service.documents().get(documentId=doc_id).execute()
+                document = execute_with_retry(docs_service.documents().get(documentId=doc_id))
                 body_content = document['body']['content']
                 
                 # Find the end index of document content
@@ -615,12 +612,12 @@ class DocsEditTool(BaseTool):
                         }
                     }
                 ]
-                docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
+                execute_with_retry(docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}), idempotent=False)
                 return f"[OK] Replaced document content with {len(text)} characters"
             
             # CLEAR operation - delete all content
             elif operation == 'clear':
-                document = docs_service.documents().get(documentId=doc_id).execute()
+                document = execute_with_retry(docs_service.documents().get(documentId=doc_id))
                 body_content = document['body']['content']
                 
                 end_index = 1
@@ -638,7 +635,7 @@ class DocsEditTool(BaseTool):
                         }
                     }
                 ]
-                docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}).execute()
+                execute_with_retry(docs_service.documents().batchUpdate(documentId=doc_id, body={'requests': requests}), idempotent=False)
                 return f"[OK] Cleared all content from document"
             
             else:
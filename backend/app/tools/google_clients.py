@@ -0,0 +1,292 @@
+"""
+Shared Google API clients.
+
+Loading the service-account key and building a discovery-based client
+is the slow part of every Drive/Docs script. The factories here do it
+once per process for each (scopes, key file) combination and hand back
+the same objects on later calls.
+
+Clients are built from the discovery documents bundled with
+google-api-python-client (static_discovery=True), so no discovery
+request goes over the network. They are safe to share between threads:
+each request is sent over the calling thread's own connection (see
+``thread_http``) rather than the service's single httplib2.Http.
+
+The Google client libraries are imported on first use, so importing
+this module (or a script that uses it) stays cheap until a client is
+actually needed.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from google.oauth2 import service_account
+
+DRIVE_SCOPE = 'https://www.googleapis.com/auth/drive'
+DOCS_SCOPE = 'https://www.googleapis.com/auth/documents'
+DEFAULT_SCOPES: Tuple[str, ...] = (DRIVE_SCOPE, DOCS_SCOPE)
+
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+
+
+def default_credentials_path() -> str:
+    """GOOGLE_APPLICATION_CREDENTIALS if absolute, else backend/credentials.json."""
+    creds_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    if not creds_path or not os.path.isabs(creds_path):
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        creds_path = os.path.join(base_dir, "credentials.json")
+    return creds_path
+
+
+@lru_cache(maxsize=8)
+def get_credentials(
+    scopes: Tuple[str, ...] = DEFAULT_SCOPES,
+    creds_path: Optional[str] = None,
+) -> "service_account.Credentials":
+    """Service-account credentials, loaded once per (scopes, key file)."""
+    from google.oauth2 import service_account
+
+    creds_path = creds_path or default_credentials_path()
+    if not os.path.exists(creds_path):
+        raise FileNotFoundError(f"Service account key not found at: {creds_path}")
+    return service_account.Credentials.from_service_account_file(creds_path, scopes=list(scopes))
+
+
+def _request_builder(credentials):
+    """requestBuilder that binds each request to the building thread's connection."""
+    from googleapiclient.http import HttpRequest
+
+    def build_request(http, *args, **kwargs):
+        return HttpRequest(thread_http(credentials), *args, **kwargs)
+
+    return build_request
+
+
+def _build(service_name: str, version: str, credentials):
+    from googleapiclient.discovery import build
+
+    return build(
+        service_name, version,
+        credentials=credentials,
+        requestBuilder=_request_builder(credentials),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+@lru_cache(maxsize=8)
+def drive_service(scopes: Tuple[str, ...] = DEFAULT_SCOPES, creds_path: Optional[str] = None):
+    """Drive v3 client, built once per (scopes, key file)."""
+    return _build('drive', 'v3', get_credentials(scopes, creds_path))
+
+
+@lru_cache(maxsize=8)
+def docs_service(scopes: Tuple[str, ...] = DEFAULT_SCOPES, creds_path: Optional[str] = None):
+    """Docs v1 client, built once per (scopes, key file)."""
+    return _build('docs', 'v1', get_credentials(scopes, creds_path))
+
+
+def iter_drive_files(
+    service,
+    drive_id: str,
+    fields: str = "id, name, mimeType, parents",
+    query: str = "trashed = false",
+):
+    """
+    Yield every non-trashed item in a Shared Drive, one page at a time.
+
+    One flat, paginated query (1000 items per page) instead of a
+    request per folder; callers rebuild the folder tree from
+    ``parents``. Items are yielded as each page arrives, so a caller
+    that only needs one pass never holds the whole listing.
+
+    Args:
+        service: Drive v3 client
+        drive_id: Shared Drive ID
+        fields: Per-file field mask
+        query: files.list ``q`` filter
+
+    Yields:
+        File resources
+    """
+    from app.tools.google_exec import execute_with_retry
+
+    page_token = None
+    while True:
+        results = execute_with_retry(service.files().list(
+            q=query,
+            corpora='drive',
+            driveId=drive_id,
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            pageSize=1000,
+            pageToken=page_token,
+            fields=f"nextPageToken, files({fields})"
+        ), max_retries=5)
+        yield from results.get('files', [])
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            break
+
+
+def list_drive_files(service, drive_id: str, fields: str = "id, name, mimeType, parents"):
+    """List every non-trashed item in a Shared Drive (see ``iter_drive_files``)."""
+    return list(iter_drive_files(service, drive_id, fields))
+
+
+def iter_text_runs(content):
+    """Yield the text of every paragraph text run in a Docs ``body.content`` list, in order."""
+    return (
+        element['textRun'].get('content', '')
+        for block in content if 'paragraph' in block
+        for element in block['paragraph'].get('elements', ()) if 'textRun' in element
+    )
+
+
+def export_doc_text(service, doc_id: str) -> str:
+    """
+    Plain text of a Google Doc, exported by Drive.
+
+    For read-only uses this is much smaller than the documents.get JSON
+    (no styles or structure) and needs no walking of the element tree.
+    Exports are capped at 10 MB, so one request returns the whole file.
+    """
+    from app.tools.google_exec import execute_with_retry
+
+    content = execute_with_retry(service.files().export_media(fileId=doc_id, mimeType='text/plain'))
+    return content.decode('utf-8-sig')
+
+
+def get_start_page_token(service, drive_id: str) -> str:
+    """Current position of a Shared Drive's change feed."""
+    from app.tools.google_exec import execute_with_retry
+
+    response = execute_with_retry(service.changes().getStartPageToken(
+        driveId=drive_id,
+        supportsAllDrives=True,
+    ))
+    return response['startPageToken']
+
+
+def get_drive_changes(
+    service,
+    drive_id: str,
+    page_token: str,
+    fields: str = "id, name, mimeType, parents",
+):
+    """
+    Items added or modified in a Shared Drive since ``page_token``.
+
+    Removed and trashed items are skipped.
+
+    Args:
+        service: Drive v3 client
+        drive_id: Shared Drive ID
+        page_token: Token from ``get_start_page_token`` or a previous call
+        fields: Per-file field mask
+
+    Returns:
+        Tuple of (file resources, token to resume from next time)
+    """
+    from app.tools.google_exec import execute_with_retry
+
+    items = []
+    while True:
+        results = execute_with_retry(service.changes().list(
+            pageToken=page_token,
+            driveId=drive_id,
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            pageSize=1000,
+            fields=f"newStartPageToken, nextPageToken, changes(removed, file({fields}, trashed))"
+        ), max_retries=5)
+        for change in results.get('changes', []):
+            item = change.get('file')
+            if change.get('removed') or not item or item.get('trashed'):
+                continue
+            items.append(item)
+        if 'newStartPageToken' in results:
+            return items, results['newStartPageToken']
+        page_token = results['nextPageToken']
+
+
+# Per-connection socket timeout. No httplib2 response cache: it would keep
+# authenticated document bodies on disk, and the discovery documents it
+# could usefully cache are bundled with the client (static_discovery).
+HTTP_TIMEOUT = 60  # seconds
+
+_thread_local = threading.local()
+
+
+def thread_http(credentials):
+    """
+    Authorized HTTP transport owned by the calling thread.
+
+    A googleapiclient service's own httplib2 connection is not
+    thread-safe. The factories above route every request through this,
+    and callers holding another service can pass it to
+    ``request.execute(http=...)`` / ``batch.execute(http=...)``. Each
+    thread then keeps a single persistent (keep-alive) connection,
+    rather than building a whole client or re-handshaking per call.
+    Connections time out after HTTP_TIMEOUT seconds.
+    """
+    http = getattr(_thread_local, 'http', None)
+    if http is None or http.credentials is not credentials:
+        import google_auth_httplib2
+        import httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(
+            credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT),
+        )
+        _thread_local.http = http
+    return http
+
+
+# Folder IDs found by name, kept between runs so scripts that look up
+# the same folders every time skip the files.list round-trips. Entries
+# expire after FOLDER_ID_CACHE_TTL in case a folder is moved or deleted.
+FOLDER_ID_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "braintrust", "drive_ids.json")
+FOLDER_ID_CACHE_TTL = 24 * 60 * 60  # seconds
+
+_folder_ids: Optional[Dict[str, Dict[str, Any]]] = None
+_folder_ids_lock = threading.Lock()
+
+
+def _load_folder_ids() -> Dict[str, Dict[str, Any]]:
+    global _folder_ids
+    if _folder_ids is None:
+        try:
+            with open(FOLDER_ID_CACHE_PATH, 'r', encoding='utf-8') as f:
+                _folder_ids = json.load(f)
+        except (OSError, ValueError):
+            _folder_ids = {}
+    return _folder_ids
+
+
+def cached_folder_id(parent_id: str, name: str) -> Optional[str]:
+    """ID of folder ``name`` under ``parent_id`` from an earlier lookup, if still fresh."""
+    with _folder_ids_lock:
+        entry = _load_folder_ids().get(f"{parent_id}/{name}")
+    if entry and time.time() - entry['saved_at'] < FOLDER_ID_CACHE_TTL:
+        return entry['id']
+    return None
+
+
+def remember_folder_id(parent_id: str, name: str, folder_id: str) -> None:
+    """Record a folder lookup (or creation) for later runs."""
+    with _folder_ids_lock:
+        folder_ids = _load_folder_ids()
+        folder_ids[f"{parent_id}/{name}"] = {'id': folder_id, 'saved_at': time.time()}
+        try:
+            os.makedirs(os.path.dirname(FOLDER_ID_CACHE_PATH), exist_ok=True)
+            tmp_path = FOLDER_ID_CACHE_PATH + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(folder_ids, f)
+            os.replace(tmp_path, FOLDER_ID_CACHE_PATH)
+        except OSError:
+            pass  # cache is best-effort
@@ -0,0 +1,99 @@
+"""
+Resilient execution of Google API requests.
+
+Drive and Docs answer bursts of traffic with 429s or 403
+``userRateLimitExceeded``/``rateLimitExceeded`` (and the occasional
+transient 5xx). Routing ``.execute()`` through ``execute_with_retry``
+turns those into short jittered waits instead of failed tool calls,
+honouring the server's Retry-After header when one is sent.
+
+Writes (create, update, batchUpdate, ...) are sent with ``idempotent=False``:
+a 5xx may arrive after the server already applied the change, so only rate
+limits, which are refused before anything happens, are retried for them.
+"""
+
+import logging
+import random
+import time
+from typing import Any, Optional
+
+from googleapiclient.errors import HttpError
+
+logger = logging.getLogger(__name__)
+
+# Retry configuration
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_STATUSES = frozenset({429})
+MAX_RETRIES = 3
+INITIAL_BACKOFF = 1  # seconds, doubled per attempt (1s, 2s, 4s)
+MAX_BACKOFF = 32  # seconds
+RATE_LIMIT_REASONS = (b"userratelimitexceeded", b"ratelimitexceeded")
+
+
+def is_retryable(error: Exception, idempotent: bool = True) -> bool:
+    """
+    True for errors worth retrying: 429, 5xx, and 403s whose reason is a
+    rate limit (a plain 403 is a permission error and is not retried).
+
+    With ``idempotent=False`` 5xx errors are not retried, since the
+    request may already have been applied.
+    """
+    status = getattr(getattr(error, "resp", None), "status", None)
+    if status in (RETRYABLE_STATUSES if idempotent else RATE_LIMIT_STATUSES):
+        return True
+    if status == 403:
+        content = (getattr(error, "content", b"") or b"").lower()
+        return any(reason in content for reason in RATE_LIMIT_REASONS)
+    return False
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with up to a second of jitter, capped at MAX_BACKOFF."""
+    return min(MAX_BACKOFF, INITIAL_BACKOFF * (2 ** attempt) + random.random())
+
+
+def _retry_after(error: HttpError) -> Optional[float]:
+    """Seconds requested by the server's Retry-After header (at most MAX_BACKOFF), if numeric."""
+    value = error.resp.get("retry-after")
+    try:
+        return min(MAX_BACKOFF, float(value)) if value else None
+    except (TypeError, ValueError):
+        return None  # HTTP-date form; fall back to exponential backoff
+
+
+def execute_with_retry(
+    request: Any,
+    max_retries: int = MAX_RETRIES,
+    idempotent: bool = True,
+    **execute_kwargs: Any,
+) -> Any:
+    """
+    Execute a googleapiclient request, retrying rate limits and 5xx errors.
+
+    Args:
+        request: An un-executed HttpRequest (e.g. ``service.files().list(...)``)
+            or BatchHttpRequest
+        max_retries: Retries after the first attempt
+        idempotent: False for writes, which are then retried on rate
+            limits only, never on 5xx
+        **execute_kwargs: Passed through to ``request.execute()`` (e.g. ``http=``)
+
+    Returns:
+        The parsed response of ``request.execute()``
+
+    Raises:
+        HttpError: Non-retryable errors, or the last error once retries run out
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute(**execute_kwargs)
+        except HttpError as e:
+            status = e.resp.status
+            if not is_retryable(e, idempotent) or attempt == max_retries:
+                raise
+            wait = _retry_after(e) or backoff_delay(attempt)
+            logger.debug(
+                f"Google API returned {status} (attempt {attempt + 1}/{max_retries + 1}), "
+                f"retrying in {wait:.1f}s"
+            )
+            time.sleep(wait)
@@ -18,8 +18,10 @@ Design Philosophy:
 import os
 import logging
 import importlib
+import threading
+from collections import Counter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 from datetime import datetime
 
 from app.tools.schema import ToolDefinition, ToolCategory, ToolExecutionResult
@@ -27,12 +29,151 @@ from app.tools.schema import ToolDefinition, ToolCategory, ToolExecutionResult
 logger = logging.getLogger(__name__)
 
 
+# Built-in tool definitions, kept as plain dicts and validated once on first use.
+# These match the existing CrewAI tools in drive_tool.py
+_BUILTIN_TOOL_DICTS: List[Dict[str, Any]] = [
+    dict(
+        tool_id="drive_list",
+        name="Google Drive Lister",
+        description="Lists files and folders in a Google Drive folder. Use 'root' for the root folder or 'all' to list predefined folders.",
+        parameters=[
+            {"name": "folder_id", "type": "string", "description": "Folder ID, 'root', or 'all'", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:DriveListTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=2000,
+        tags=["drive", "files", "list"],
+    ),
+    dict(
+        tool_id="drive_read",
+        name="Google Doc Reader",
+        description="Reads the text content of a Google Doc by its file ID.",
+        parameters=[
+            {"name": "file_id", "type": "string", "description": "The Google Doc file ID", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:DriveReadTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=3000,
+        tags=["drive", "read", "document"],
+    ),
+    dict(
+        tool_id="drive_write",
+        name="Google Doc Creator",
+        description="Creates a new Google Doc with the specified title and content in a folder.",
+        parameters=[
+            {"name": "title", "type": "string", "description": "Document title", "required": True},
+            {"name": "content", "type": "string", "description": "Document content", "required": True},
+            {"name": "folder", "type": "string", "description": "Target folder name", "required": True},
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:DriveWriteTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=5000,
+        tags=["drive", "write", "create"],
+    ),
+    dict(
+        tool_id="find_folder",
+        name="Google Drive Folder Finder",
+        description="Finds a folder by name in Google Drive and returns its ID.",
+        parameters=[
+            {"name": "folder_name", "type": "string", "description": "Name of the folder to find", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:FindFolderTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=2000,
+        tags=["drive", "folder", "search"],
+    ),
+    dict(
+        tool_id="docs_edit",
+        name="Google Docs Editor",
+        description="Edits an existing Google Doc by inserting or replacing text.",
+        parameters=[
+            {"name": "file_id", "type": "string", "description": "The Google Doc file ID", "required": True},
+            {"name": "insert_text", "type": "string", "description": "Text to insert at the end", "required": False},
+            {"name": "replace_text", "type": "string", "description": "Text to replace entire content with", "required": False},
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:DocsEditTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=4000,
+        tags=["drive", "edit", "document"],
+    ),
+    dict(
+        tool_id="word_export",
+        name="Word Document Exporter",
+        description="Exports a Google Doc to Word format (.docx).",
+        parameters=[
+            {"name": "file_id", "type": "string", "description": "The Google Doc file ID", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:WordDocExportTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=5000,
+        tags=["drive", "export", "word"],
+    ),
+    dict(
+        tool_id="cached_file_read",
+        name="Cached File Reader",
+        description="Reads full content from a cached file path (for large documents).",
+        parameters=[
+            {"name": "cache_path", "type": "string", "description": "Path to the cached file", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:CachedFileReadTool",
+        category="file",
+        requires_auth=False,
+        estimated_latency_ms=100,
+        tags=["cache", "read", "file"],
+    ),
+    dict(
+        tool_id="plain_text_read",
+        name="Plain Text File Reader",
+        description="Reads plain text files (.md, .txt, .json, .yaml) from Google Drive. Use for markdown and non-Google-Doc formats.",
+        parameters=[
+            {"name": "file_id", "type": "string", "description": "The file ID of the text file to read", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:PlainTextFileReadTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=2000,
+        tags=["drive", "read", "markdown", "text", "document"],
+    ),
+    dict(
+        tool_id="universal_file_read",
+        name="Universal File Reader",
+        description="Reads ANY file from Google Drive - automatically detects file type (Google Docs, .docx, .txt, .md, .json, spreadsheets) and uses the appropriate method. Best choice when you don't know the file type.",
+        parameters=[
+            {"name": "file_id", "type": "string", "description": "The file ID of any file to read", "required": True}
+        ],
+        returns="string",
+        executor="app.tools.drive_tool:UniversalFileReadTool",
+        category="file",
+        requires_auth=True,
+        estimated_latency_ms=3000,
+        tags=["drive", "read", "document", "universal", "auto-detect"],
+    ),
+]
+
+
 class ToolRegistry:
     """
     Central registry for all available tools.
 
+    Shared access goes through get_registry(); constructing a
+    ToolRegistry directly gives an independent instance.
+
     Usage:
-        registry = ToolRegistry()
+        registry = get_registry()
 
         # Get tools for CrewAI
         crewai_tools = registry.get_for_adapter("crewai")
@@ -44,185 +185,50 @@ class ToolRegistry:
         result = registry.execute("drive_list", folder_id="root")
     """
 
-    _instance = None
-    _BUILTIN_TOOLS_LOADED = False
-
-    def __new__(cls):
-        """Singleton pattern for shared registry access."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    _BUILTIN_TOOL_CACHE: Optional[List[ToolDefinition]] = None
 
     def __init__(self):
-        if self._initialized:
-            return
-
         self._tools: Dict[str, ToolDefinition] = {}
         self._executors: Dict[str, Callable] = {}
+        self._module_cache: Dict[str, Any] = {}
         self._adapters: Dict[str, Any] = {}
         self._last_user_scan: float = 0
         self._user_scan_interval: int = 60  # seconds
-
-        # Load tools
+        self._user_dir_mtime: float = 0.0
+        # path -> (mtime, parsed tools); unchanged files are not re-parsed
+        self._yaml_cache: Dict[str, Tuple[float, List[ToolDefinition]]] = {}
+        # Guards the user-scan state above and swaps of self._tools
+        self._user_tools_lock = threading.Lock()
+
+        # Built-ins are ready immediately; user YAML is parsed and validated
+        # off the request path and merged in when it finishes.
         self._load_builtin_tools()
-        self._load_user_tools()
+        self._user_tools_thread: Optional[threading.Thread] = threading.Thread(
+            target=self._load_user_tools, name="tool-registry-user-tools", daemon=True
+        )
+        self._user_tools_thread.start()
 
-        self._initialized = True
-        logger.info(f"ToolRegistry initialized with {len(self._tools)} tools")
+        logger.info("ToolRegistry initialized; user tools loading in background")
 
     def _load_builtin_tools(self) -> None:
-        """Load built-in tool definitions."""
-        if ToolRegistry._BUILTIN_TOOLS_LOADED:
-            return
+        """Load built-in tool definitions into a fresh tools dict."""
+        if ToolRegistry._BUILTIN_TOOL_CACHE is None:
+            # Validate the whole list in one pass; reused by reloads
+            ToolRegistry._BUILTIN_TOOL_CACHE = ToolDefinition.validate_many(_BUILTIN_TOOL_DICTS)
 
-        # Define built-in tools programmatically
-        # These match the existing CrewAI tools in drive_tool.py
-        builtin_tools = [
-            ToolDefinition(
-                tool_id="drive_list",
-                name="Google Drive Lister",
-                description="Lists files and folders in a Google Drive folder. Use 'root' for the root folder or 'all' to list predefined folders.",
-                parameters=[
-                    {"name": "folder_id", "type": "string", "description": "Folder ID, 'root', or 'all'", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:DriveListTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=2000,
-                tags=["drive", "files", "list"],
-            ),
-            ToolDefinition(
-                tool_id="drive_read",
-                name="Google Doc Reader",
-                description="Reads the text content of a Google Doc by its file ID.",
-                parameters=[
-                    {"name": "file_id", "type": "string", "description": "The Google Doc file ID", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:DriveReadTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=3000,
-                tags=["drive", "read", "document"],
-            ),
-            ToolDefinition(
-                tool_id="drive_write",
-                name="Google Doc Creator",
-                description="Creates a new Google Doc with the specified title and content in a folder.",
-                parameters=[
-                    {"name": "title", "type": "string", "description": "Document title", "required": True},
-                    {"name": "content", "type": "string", "description": "Document content", "required": True},
-                    {"name": "folder", "type": "string", "description": "Target folder name", "required": True},
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:DriveWriteTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=5000,
-                tags=["drive", "write", "create"],
-            ),
-            ToolDefinition(
-                tool_id="find_folder",
-                name="Google Drive Folder Finder",
-                description="Finds a folder by name in Google Drive and returns its ID.",
-                parameters=[
-                    {"name": "folder_name", "type": "string", "description": "Name of the folder to find", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:FindFolderTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=2000,
-                tags=["drive", "folder", "search"],
-            ),
-            ToolDefinition(
-                tool_id="docs_edit",
-                name="Google Docs Editor",
-                description="Edits an existing Google Doc by inserting or replacing text.",
-                parameters=[
-                    {"name": "file_id", "type": "string", "description": "The Google Doc file ID", "required": True},
-                    {"name": "insert_text", "type": "string", "description": "Text to insert at the end", "required": False},
-                    {"name": "replace_text", "type": "string", "description": "Text to replace entire content with", "required": False},
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:DocsEditTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=4000,
-                tags=["drive", "edit", "document"],
-            ),
-            ToolDefinition(
-                tool_id="word_export",
-                name="Word Document Exporter",
-                description="Exports a Google Doc to Word format (.docx).",
-                parameters=[
-                    {"name": "file_id", "type": "string", "description": "The Google Doc file ID", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:WordDocExportTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=5000,
-                tags=["drive", "export", "word"],
-            ),
-            ToolDefinition(
-                tool_id="cached_file_read",
-                name="Cached File Reader",
-                description="Reads full content from a cached file path (for large documents).",
-                parameters=[
-                    {"name": "cache_path", "type": "string", "description": "Path to the cached file", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:CachedFileReadTool",
-                category="file",
-                requires_auth=False,
-                estimated_latency_ms=100,
-                tags=["cache", "read", "file"],
-            ),
-            ToolDefinition(
-                tool_id="plain_text_read",
-                name="Plain Text File Reader",
-                description="Reads plain text files (.md, .txt, .json, .yaml) from Google Drive. Use for markdown and non-Google-Doc formats.",
-                parameters=[
-                    {"name": "file_id", "type": "string", "description": "The file ID of the text file to read", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:PlainTextFileReadTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=2000,
-                tags=["drive", "read", "markdown", "text", "document"],
-            ),
-            ToolDefinition(
-                tool_id="universal_file_read",
-                name="Universal File Reader",
-                description="Reads ANY file from Google Drive - automatically detects file type (Google Docs, .docx, .txt, .md, .json, spreadsheets) and uses the appropriate method. Best choice when you don't know the file type.",
-                parameters=[
-                    {"name": "file_id", "type": "string", "description": "The file ID of any file to read", "required": True}
-                ],
-                returns="string",
-                executor="app.tools.drive_tool:UniversalFileReadTool",
-                category="file",
-                requires_auth=True,
-                estimated_latency_ms=3000,
-                tags=["drive", "read", "document", "universal", "auto-detect"],
-            ),
-        ]
-
-        for tool_data in builtin_tools:
-            if isinstance(tool_data, ToolDefinition):
-                tool = tool_data
-            else:
-                tool = ToolDefinition.from_dict(tool_data)
-            self._tools[tool.tool_id] = tool
+        # Swapped in whole, like user-tool merges, so unlocked readers
+        # iterating the previous dict are never disturbed
+        self._tools = {tool.tool_id: tool for tool in ToolRegistry._BUILTIN_TOOL_CACHE}
 
-        ToolRegistry._BUILTIN_TOOLS_LOADED = True
-        logger.info(f"Loaded {len(builtin_tools)} built-in tools")
+        logger.info(f"Loaded {len(ToolRegistry._BUILTIN_TOOL_CACHE)} built-in tools")
 
     def _load_user_tools(self) -> None:
         """Load user-defined tools from ~/.pai/tools/"""
+        with self._user_tools_lock:
+            self._scan_user_tools()
+
+    def _scan_user_tools(self) -> None:
+        """Scan ~/.pai/tools/; caller holds _user_tools_lock."""
         import time
 
         # Rate-limit rescans
@@ -232,21 +238,55 @@ class ToolRegistry:
         self._last_user_scan = now
 
         user_tools_dir = Path.home() / ".pai" / "tools"
-        if not user_tools_dir.exists():
+        try:
+            dir_mtime = user_tools_dir.stat().st_mtime
+        except OSError:
+            return  # No user tools directory
+
+        # Adding, removing or renaming a file bumps the directory mtime;
+        # if it hasn't moved, skip the glob and per-file stats entirely.
+        # In-place edits are picked up on reload().
+        if dir_mtime == self._user_dir_mtime:
             return
+        self._user_dir_mtime = dir_mtime
 
-        loaded_count = 0
+        loaded: Dict[str, ToolDefinition] = {}
         for yaml_file in user_tools_dir.glob("*.yaml"):
+            path = str(yaml_file)
             try:
-                tools = ToolDefinition.from_yaml_file(str(yaml_file))
+                mtime = yaml_file.stat().st_mtime
+                cached = self._yaml_cache.get(path)
+                if cached is not None and cached[0] == mtime:
+                    tools = cached[1]
+                else:
+                    tools = ToolDefinition.from_yaml_file(path)
+                    self._yaml_cache[path] = (mtime, tools)
+                    for tool in tools:
+                        self._invalidate_converted(tool.tool_id)
                 for tool in tools:
-                    self._tools[tool.tool_id] = tool
-                    loaded_count += 1
+                    loaded[tool.tool_id] = tool
             except Exception as e:
                 logger.warning(f"Failed to load tools from {yaml_file}: {e}")
 
-        if loaded_count > 0:
-            logger.info(f"Loaded {loaded_count} user tools from {user_tools_dir}")
+        if loaded:
+            # Copy-and-swap so readers iterating the old dict are never
+            # disturbed by a background merge.
+            merged = dict(self._tools)
+            merged.update(loaded)
+            self._tools = merged
+            logger.info(f"Loaded {len(loaded)} user tools from {user_tools_dir}")
+
+    def _wait_for_user_tools(self) -> None:
+        """
+        Block until the initial background user-tool load has finished.
+
+        Every lookup that lists tools calls this, so agents built right
+        after startup see the same tools as later ones.
+        """
+        thread = self._user_tools_thread
+        if thread is not None:
+            thread.join()
+            self._user_tools_thread = None
 
     def register(self, tool: ToolDefinition, executor: Optional[Callable] = None) -> None:
         """
@@ -256,34 +296,56 @@ class ToolRegistry:
             tool: The tool definition
             executor: Optional callable to execute the tool
         """
-        self._tools[tool.tool_id] = tool
+        with self._user_tools_lock:
+            self._tools = {**self._tools, tool.tool_id: tool}
         if executor:
             self._executors[tool.tool_id] = executor
+        self._invalidate_converted(tool.tool_id)
         logger.debug(f"Registered tool: {tool.tool_id}")
 
     def unregister(self, tool_id: str) -> None:
         """Remove a tool from the registry."""
-        self._tools.pop(tool_id, None)
+        with self._user_tools_lock:
+            self._tools = {tid: t for tid, t in self._tools.items() if tid != tool_id}
         self._executors.pop(tool_id, None)
+        self._invalidate_converted(tool_id)
+
+    def _invalidate_converted(self, tool_id: Optional[str] = None) -> None:
+        """Drop the adapters' cached conversions for one tool, or for all tools."""
+        # Snapshot: may run on the loader thread while _get_adapter inserts
+        for adapter in list(self._adapters.values()):
+            if tool_id is None:
+                adapter.clear_cache()
+            else:
+                adapter.invalidate(tool_id)
 
     def get(self, tool_id: str) -> Optional[ToolDefinition]:
         """Get a tool definition by ID."""
-        return self._tools.get(tool_id)
+        tool = self._tools.get(tool_id)
+        if tool is None and self._user_tools_thread is not None:
+            # May be a user tool that is still loading
+            self._wait_for_user_tools()
+            tool = self._tools.get(tool_id)
+        return tool
 
     def get_all(self) -> List[ToolDefinition]:
         """Get all registered tools."""
+        self._wait_for_user_tools()
         return list(self._tools.values())
 
     def get_enabled(self) -> List[ToolDefinition]:
         """Get only enabled (non-deprecated) tools."""
+        self._wait_for_user_tools()
         return [t for t in self._tools.values() if t.enabled and not t.deprecated]
 
     def get_by_category(self, category: ToolCategory) -> List[ToolDefinition]:
         """Get tools by category."""
+        self._wait_for_user_tools()
         return [t for t in self._tools.values() if t.category == category]
 
     def get_by_tags(self, tags: List[str]) -> List[ToolDefinition]:
         """Get tools that have any of the specified tags."""
+        self._wait_for_user_tools()
         tag_set = set(tags)
         return [t for t in self._tools.values() if tag_set & set(t.tags)]
 
@@ -297,6 +359,7 @@ class ToolRegistry:
         - developer: code tools
         - researcher: search tools
         """
+        self._wait_for_user_tools()
         role_lower = role.lower()
 
         if "librarian" in role_lower:
@@ -339,13 +402,15 @@ class ToolRegistry:
 
         # Determine which tools to include
         if tool_ids:
+            if self._user_tools_thread is not None and not all(tid in self._tools for tid in tool_ids):
+                self._wait_for_user_tools()
             tools = [self._tools[tid] for tid in tool_ids if tid in self._tools]
         elif role:
             tools = self.get_for_role(role)
         else:
             tools = self.get_enabled()
 
-        # Convert using adapter
+        # Convert using adapter (which caches conversions per tool)
         converted = []
         for tool in tools:
             try:
@@ -398,21 +463,24 @@ class ToolRegistry:
             return None
 
         try:
-            executor = self._load_executor(tool.executor)
+            executor = self._load_executor(*tool.get_executor_parts())
             self._executors[tool_id] = executor
             return executor
         except Exception as e:
             logger.error(f"Failed to load executor for {tool_id}: {e}")
             return None
 
-    def _load_executor(self, executor_path: str) -> Callable:
+    def _load_executor(self, module_path: str, name: str) -> Callable:
         """
-        Load executor from module path.
+        Load executor from a pre-split module path.
 
-        Format: "module.path:ClassName" or "module.path:function_name"
+        Most built-in tools share app.tools.drive_tool, so modules are
+        cached locally and only the attribute lookup repeats.
         """
-        module_path, name = executor_path.rsplit(":", 1)
-        module = importlib.import_module(module_path)
+        module = self._module_cache.get(module_path)
+        if module is None:
+            module = importlib.import_module(module_path)
+            self._module_cache[module_path] = module
         return getattr(module, name)
 
     def execute(self, tool_id: str, **kwargs) -> ToolExecutionResult:
@@ -475,25 +543,26 @@ class ToolRegistry:
 
     def reload(self) -> None:
         """Reload all tools."""
-        self._tools.clear()
-        self._executors.clear()
-        ToolRegistry._BUILTIN_TOOLS_LOADED = False
-        self._last_user_scan = 0
-        self._load_builtin_tools()
-        self._load_user_tools()
+        self._wait_for_user_tools()
+        with self._user_tools_lock:
+            self._executors = {}
+            self._invalidate_converted()
+            self._last_user_scan = 0
+            self._user_dir_mtime = 0.0
+            self._load_builtin_tools()
+            self._scan_user_tools()
         logger.info(f"Registry reloaded with {len(self._tools)} tools")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics."""
-        by_category = {}
-        for tool in self._tools.values():
-            cat = tool.category.value
-            by_category[cat] = by_category.get(cat, 0) + 1
+        self._wait_for_user_tools()
+        tools = self._tools.values()
+        by_category = Counter(t.category.value for t in tools)
 
         return {
             "total_tools": len(self._tools),
-            "enabled_tools": len(self.get_enabled()),
-            "by_category": by_category,
+            "enabled_tools": sum(1 for t in tools if t.enabled and not t.deprecated),
+            "by_category": dict(by_category),
             "adapters_loaded": list(self._adapters.keys()),
         }
 
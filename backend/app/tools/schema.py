@@ -16,11 +16,23 @@ tool definitions from framework-specific implementations.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import TypeAdapter
 import json
 import yaml
 
+# orjson is optional; used for faster result serialization when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C loader is several times faster; fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ParameterType(str, Enum):
     """Supported parameter types for tool inputs."""
@@ -55,7 +67,8 @@ class ToolCategory(str, Enum):
     GENERAL = "general"     # Uncategorized
 
 
-class ToolParameter(BaseModel):
+@dataclass(slots=True)
+class ToolParameter:
     """
     Definition of a single tool parameter.
 
@@ -67,12 +80,12 @@ class ToolParameter(BaseModel):
           default: null
           enum: null
     """
-    name: str = Field(..., description="Parameter name (snake_case)")
-    type: ParameterType = Field(default=ParameterType.STRING)
-    description: str = Field(default="", description="Human-readable description")
-    required: bool = Field(default=True)
-    default: Optional[Any] = Field(default=None)
-    enum: Optional[List[str]] = Field(default=None, description="Allowed values")
+    name: str                                   # Parameter name (snake_case)
+    type: ParameterType = ParameterType.STRING
+    description: str = ""                       # Human-readable description
+    required: bool = True
+    default: Optional[Any] = None
+    enum: Optional[List[str]] = None            # Allowed values
 
     def to_json_schema(self) -> Dict[str, Any]:
         """Convert to JSON Schema format (for OpenAI/Anthropic)."""
@@ -87,7 +100,8 @@ class ToolParameter(BaseModel):
         return schema
 
 
-class ToolDefinition(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ToolDefinition:
     """
     Provider-agnostic tool definition.
 
@@ -110,32 +124,43 @@ class ToolDefinition(BaseModel):
         estimated_latency_ms: 2000
     """
     # Identity
-    tool_id: str = Field(..., description="Unique identifier (snake_case)")
-    name: str = Field(..., description="Human-readable name")
-    description: str = Field(..., description="What this tool does")
+    tool_id: str                                # Unique identifier (snake_case)
+    name: str                                   # Human-readable name
+    description: str                            # What this tool does
 
     # Interface
-    parameters: List[ToolParameter] = Field(default_factory=list)
-    returns: ParameterType = Field(default=ParameterType.STRING)
-    returns_description: str = Field(default="Tool output")
+    parameters: List[ToolParameter] = field(default_factory=list)
+    returns: ParameterType = ParameterType.STRING
+    returns_description: str = "Tool output"
 
-    # Implementation
-    executor: str = Field(
-        ...,
-        description="Module path to implementation (module:class or module:function)"
-    )
+    # Implementation: module path (module:class or module:function)
+    executor: str
 
     # Metadata
-    version: str = Field(default="1.0.0")
-    category: ToolCategory = Field(default=ToolCategory.GENERAL)
-    requires_auth: bool = Field(default=False)
-    estimated_latency_ms: int = Field(default=1000)
-    tags: List[str] = Field(default_factory=list)
+    version: str = "1.0.0"
+    category: ToolCategory = ToolCategory.GENERAL
+    requires_auth: bool = False
+    estimated_latency_ms: int = 1000
+    tags: List[str] = field(default_factory=list)
 
     # Runtime
-    enabled: bool = Field(default=True)
-    deprecated: bool = Field(default=False)
-    deprecation_message: str = Field(default="")
+    enabled: bool = True
+    deprecated: bool = False
+    deprecation_message: str = ""
+
+    # Provider-format caches, filled on first use. Definitions are treated
+    # as immutable once built; register a new object to change a tool.
+    _json_schema: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _openai_function: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _anthropic_tool: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _executor_parts: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    def get_executor_parts(self) -> Tuple[str, str]:
+        """Split ``executor`` into (module_path, attribute_name), once."""
+        if self._executor_parts is None:
+            module_path, name = self.executor.rsplit(":", 1)
+            self._executor_parts = (module_path, name)
+        return self._executor_parts
 
     def get_required_params(self) -> List[ToolParameter]:
         """Get list of required parameters."""
@@ -150,39 +175,46 @@ class ToolDefinition(BaseModel):
         Convert to JSON Schema format for function calling.
 
         Returns schema compatible with OpenAI/Anthropic function calling.
+        The result is computed once and shared; callers must not mutate it.
         """
-        properties = {}
-        required = []
-
-        for param in self.parameters:
-            properties[param.name] = param.to_json_schema()
-            if param.required:
-                required.append(param.name)
-
-        return {
-            "type": "object",
-            "properties": properties,
-            "required": required,
-        }
+        if self._json_schema is None:
+            properties = {}
+            required = []
+
+            for param in self.parameters:
+                properties[param.name] = param.to_json_schema()
+                if param.required:
+                    required.append(param.name)
+
+            self._json_schema = {
+                "type": "object",
+                "properties": properties,
+                "required": required,
+            }
+        return self._json_schema
 
     def to_openai_function(self) -> Dict[str, Any]:
-        """Convert to OpenAI function calling format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.tool_id,
-                "description": self.description,
-                "parameters": self.to_json_schema(),
+        """Convert to OpenAI function calling format (cached)."""
+        if self._openai_function is None:
+            self._openai_function = {
+                "type": "function",
+                "function": {
+                    "name": self.tool_id,
+                    "description": self.description,
+                    "parameters": self.to_json_schema(),
+                }
             }
-        }
+        return self._openai_function
 
     def to_anthropic_tool(self) -> Dict[str, Any]:
-        """Convert to Anthropic tool_use format."""
-        return {
-            "name": self.tool_id,
-            "description": self.description,
-            "input_schema": self.to_json_schema(),
-        }
+        """Convert to Anthropic tool_use format (cached)."""
+        if self._anthropic_tool is None:
+            self._anthropic_tool = {
+                "name": self.tool_id,
+                "description": self.description,
+                "input_schema": self.to_json_schema(),
+            }
+        return self._anthropic_tool
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -253,20 +285,37 @@ class ToolDefinition(BaseModel):
     @classmethod
     def from_yaml(cls, yaml_str: str) -> "ToolDefinition":
         """Create from YAML string."""
-        data = yaml.safe_load(yaml_str)
+        data = yaml.load(yaml_str, Loader=_YamlLoader)
         return cls.from_dict(data)
 
     @classmethod
     def from_yaml_file(cls, path: str) -> List["ToolDefinition"]:
         """Load tool definitions from a YAML file."""
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         # Handle both single tool and multiple tools
         if "tools" in data:
-            return [cls.from_dict(t) for t in data["tools"]]
+            return cls.validate_many(data["tools"])
         else:
-            return [cls.from_dict(data)]
+            return cls.validate_many([data])
+
+    @classmethod
+    def validate_many(cls, data: List[Dict[str, Any]]) -> List["ToolDefinition"]:
+        """
+        Validate a list of raw tool dicts (YAML input, built-ins).
+
+        Pydantic is only used here, at the untrusted-input boundary;
+        everything downstream works with the plain dataclasses.
+        """
+        global _tool_list_adapter
+        if _tool_list_adapter is None:
+            _tool_list_adapter = TypeAdapter(List[ToolDefinition])
+        return _tool_list_adapter.validate_python(data)
+
+
+# Built lazily by ToolDefinition.validate_many
+_tool_list_adapter: Optional[TypeAdapter] = None
 
 
 @dataclass
@@ -284,4 +333,15 @@ class ToolExecutionResult:
             return f"Error: {self.error}"
         if isinstance(self.output, str):
             return self.output
+        if isinstance(self.output, (int, float, bool)):
+            return str(self.output)
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    self.output,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                ).decode()
+            except TypeError:
+                pass  # e.g. ints beyond 64 bits; stdlib handles those
         return json.dumps(self.output, indent=2, default=str)
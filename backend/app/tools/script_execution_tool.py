@@ -3,15 +3,78 @@ Dynamic Script Execution Tool
 Scans ~/.pai/skills/ for executable scripts and exposes them as CrewAI tools.
 """
 
+import asyncio
+import atexit
+import hashlib
 import os
 import subprocess
+import tempfile
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import json
 import re
+import stat
+from collections import deque
+from itertools import islice
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+except ImportError:  # Fall back to periodic rescans
+    FileSystemEventHandler = object
+    Observer = None
+    PollingObserver = None
+
+def _base_env() -> Dict[str, str]:
+    """
+    Environment for a script subprocess: the current os.environ, so keys
+    loaded later (e.g. by load_dotenv) reach scripts, plus UTF-8 stdio.
+    """
+    return {**os.environ, 'PYTHONIOENCODING': 'utf-8'}
+
+# Output retained per script run; earlier output is dropped
+MAX_STDOUT_BYTES = 1024 * 1024
+MAX_STDERR_BYTES = 64 * 1024
+_READ_CHUNK = 64 * 1024
+
+# Script header lines: "# NAME: ...", "# DESCRIPTION: ...", "# PARAM: ...",
+# "# PERSISTENT: true", "# LARGE_OUTPUT: true"
+_HEADER_RE = re.compile(r'# (NAME|DESCRIPTION|PARAM|PERSISTENT|LARGE_OUTPUT):(.*)')
+# PARAM value: "query (str) - The search query"
+_PARAM_RE = re.compile(r'(\w+)\s*\((\w+)\)\s*-\s*(.+)')
+
+# Parsed metadata persisted between runs, keyed by path + (mtime_ns, size).
+# One file per skills directory, kept outside it so saving the cache does
+# not wake the watcher.
+METADATA_CACHE_DIR = Path.home() / ".cache" / "braintrust" / "skills"
+METADATA_CACHE_VERSION = 4  # bump when parsed fields change
+
+
+def _metadata_cache_path(skills_dir: Path) -> Path:
+    """Metadata cache file for one skills directory."""
+    digest = hashlib.sha1(str(skills_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return METADATA_CACHE_DIR / f"{digest}.json"
+
+# Warm interpreters for "# PERSISTENT: true" skills are closed after this
+PERSISTENT_IDLE_TIMEOUT = 300  # seconds
+
+
+# Recognised script extensions (lowercase, without the dot)
+_SCRIPT_EXTS = frozenset({"py", "sh", "bat", "cmd", "ps1"})
+
+
+def _is_script(name: str, st: os.stat_result) -> bool:
+    """A known script extension, or (on POSIX) any executable file."""
+    if name.rpartition(".")[2].lower() in _SCRIPT_EXTS:
+        return True
+    # Windows has no executable bit; rely on the extension alone there
+    return os.name != "nt" and bool(st.st_mode & 0o111)
 
 
 class ScriptMetadata(BaseModel):
@@ -20,6 +83,8 @@ class ScriptMetadata(BaseModel):
     description: str
     parameters: List[Dict[str, str]]  # [{"name": "query", "type": "str", "description": "..."}]
     script_path: Path
+    persistent: bool = False  # Run in a warm, reused interpreter
+    large_output: bool = False  # Send stdout to a temp file, not a pipe
 
 
 import sys
@@ -34,85 +99,365 @@ class ScriptExecutionTool(BaseTool):
     
     CRITICAL FLAW #5: Blocking I/O.
     Long-running scripts block the agent loop.
-    MITIGATION: Timeout enforcement (implemented below).
+    MITIGATION: Async subprocess execution (_arun) plus timeout
+    enforcement; timed-out scripts are killed.
     """
     
     name: str = "execute_script"
     description: str = "Execute a user-defined script from the skills library"
     script_path: Path
     timeout: int = 30  # seconds
+    persistent: bool = False  # Python skills only: reuse a warm interpreter
+    large_output: bool = False  # stdout goes to a temp file instead of a pipe
+    
+    # Derived from script_path once, not on every call
+    _script_path_str: str = PrivateAttr(default="")
+    _cmd_prefix: Tuple[str, ...] = PrivateAttr(default=())
+    
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._script_path_str = str(self.script_path)
+        # Case-insensitive check for python scripts
+        if self._script_path_str.lower().endswith('.py'):
+            self._cmd_prefix = (sys.executable, self._script_path_str)
+        else:
+            self._cmd_prefix = (self._script_path_str,)
     
     def _run(self, **kwargs) -> str:
         """
-        Execute the script with provided arguments.
+        Execute the script with provided arguments (blocking).
+        
+        Thin wrapper over _arun: drives it on a private event loop, or on
+        a worker thread when called from inside a running loop.
         
         Args:
             **kwargs: Script parameters (parsed from docstring)
         
         Returns:
-            Script stdout as string
+            Script stdout as string, or an "ERROR: ..." message
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_coroutine(self._arun(**kwargs))
         
-        Raises:
-            subprocess.TimeoutExpired: If script exceeds timeout
-            subprocess.CalledProcessError: If script exits non-zero
+        # A loop is already running on this thread; don't nest inside it
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(_run_coroutine, self._arun(**kwargs)).result()
+    
+    async def _arun(self, **kwargs) -> str:
+        """
+        Execute the script without blocking the event loop.
+        
+        Args:
+            **kwargs: Script parameters (parsed from docstring)
+        
+        Returns:
+            Script stdout as string, or an "ERROR: ..." message
         """
+        # Append arguments (assumes positional args in order)
+        args = [str(value) for value in kwargs.values()]
+        cmd = [*self._cmd_prefix, *args]
+        
         try:
-            # Build command
-            script_path_str = str(self.script_path)
-            
-            # Case-insensitive check for python scripts
-            is_python = script_path_str.lower().endswith('.py')
-            
-            if is_python:
-                cmd = [sys.executable, script_path_str]
-            else:
-                cmd = [script_path_str]
-            
-            # Append arguments (assumes positional args in order)
-            for key, value in kwargs.items():
-                cmd.append(str(value))
-            
-            # Execute with timeout
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                check=True,
-                env=os.environ.copy()  # Inherit environment
-            )
-            
-            return result.stdout.strip()
+            if self.persistent and len(self._cmd_prefix) == 2:
+                return await self._exec_persistent(args)
+            return await self._exec(cmd)
             
+        except asyncio.TimeoutError:
+            # Checked first: on 3.11+ it is the builtin TimeoutError, an OSError
+            return f"ERROR: Script exceeded {self.timeout}s timeout"
         except OSError as e:
             # Handle [WinError 193] %1 is not a valid Win32 application
             # This happens when trying to execute a script directly that Windows doesn't recognize
             if getattr(e, 'winerror', 0) == 193 or e.errno == 8: # errno 8 is Exec format error on Linux
                 try:
                     # Fallback: Try to run with python interpreter
-                    cmd = [sys.executable, str(self.script_path)]
-                    for key, value in kwargs.items():
-                        cmd.append(str(value))
-                        
-                    result = subprocess.run(
-                        cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=self.timeout,
-                        check=True,
-                        env=os.environ.copy()
-                    )
-                    return result.stdout.strip()
+                    return await self._exec([sys.executable, self._script_path_str, *args])
                 except Exception as fallback_e:
                     return f"ERROR: Failed to run script directly and fallback failed: {str(e)} -> {str(fallback_e)}"
             return f"ERROR: OS Error execution failed: {str(e)}"
             
-        except subprocess.TimeoutExpired:
-            return f"ERROR: Script exceeded {self.timeout}s timeout"
-        except subprocess.CalledProcessError as e:
-            return f"ERROR: Script failed with exit code {e.returncode}\n{e.stderr}"
         except Exception as e:
             return f"ERROR: {str(e)}"
+    
+    async def _exec(self, cmd: List[str]) -> str:
+        """
+        Run a command with timeout enforcement.
+        
+        Raises:
+            asyncio.TimeoutError: If the script exceeds timeout (it is killed)
+        """
+        if self.large_output:
+            # Big writers fill a file at disk speed rather than stalling
+            # on 64 KiB pipe buffers; only the tail is read back
+            with tempfile.TemporaryFile() as out_file:
+                returncode, _, stderr = await self._spawn_and_wait(cmd, out_file)
+                stdout = _read_file_tail(out_file, MAX_STDOUT_BYTES)
+        else:
+            returncode, stdout, stderr = await self._spawn_and_wait(cmd, None)
+        
+        if returncode != 0:
+            return f"ERROR: Script failed with exit code {returncode}\n{_decode(stderr)}"
+        return _decode(stdout).strip()
+    
+    async def _spawn_and_wait(self, cmd: List[str], out_file) -> Tuple[int, Optional[bytes], bytes]:
+        """
+        Start the process and wait for it, draining its pipes.
+        
+        stdout goes to out_file when given (and None is returned for it);
+        otherwise its bounded tail is captured.
+        
+        Returns:
+            (returncode, stdout_tail, stderr_tail)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=out_file if out_file is not None else asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_base_env()  # Inherit environment
+        )
+        readers = [_read_tail(proc.stderr, MAX_STDERR_BYTES), proc.wait()]
+        if out_file is None:
+            readers.append(_read_tail(proc.stdout, MAX_STDOUT_BYTES))
+        try:
+            # Drain pipes concurrently, keeping only a bounded tail
+            results = await asyncio.wait_for(asyncio.gather(*readers), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # Kill and reap so no orphaned child is left behind
+            proc.kill()
+            await proc.wait()
+            raise
+        stdout = results[2] if out_file is None else None
+        return proc.returncode, stdout, results[0]
+    
+    async def _exec_persistent(self, args: List[str]) -> str:
+        """
+        Run a Python skill in its warm interpreter.
+        
+        Raises:
+            asyncio.TimeoutError: If the script exceeds timeout (worker is killed)
+        """
+        runner = _get_persistent_runner(self._script_path_str)
+        returncode, stdout, stderr = await asyncio.to_thread(runner.run, args, self.timeout)
+        if returncode != 0:
+            return f"ERROR: Script failed with exit code {returncode}\n{_tail_text(stderr, MAX_STDERR_BYTES)}"
+        return _tail_text(stdout, MAX_STDOUT_BYTES).strip()
+
+
+async def _read_tail(stream: asyncio.StreamReader, limit: int) -> bytes:
+    """
+    Read a stream to EOF, retaining at most the last `limit` bytes.
+    
+    Runaway output costs O(limit) memory instead of O(output).
+    """
+    chunks: deque = deque()
+    total = 0
+    truncated = False
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+        while total - len(chunks[0]) >= limit:
+            total -= len(chunks.popleft())
+            truncated = True
+    
+    data = b"".join(chunks)
+    if len(data) > limit:
+        data = data[-limit:]
+        truncated = True
+    if truncated:
+        data = b"[output truncated to last %d bytes]\n" % limit + data
+    return data
+
+
+def _read_file_tail(f, limit: int) -> bytes:
+    """Read at most the last `limit` bytes of a file."""
+    size = f.seek(0, os.SEEK_END)
+    f.seek(max(0, size - limit))
+    data = f.read()
+    if size > limit:
+        data = b"[output truncated to last %d bytes]\n" % limit + data
+    return data
+
+
+def _tail_text(text: str, limit: int) -> str:
+    """Text counterpart of _read_tail for already-decoded output."""
+    if len(text) <= limit:
+        return text
+    return f"[output truncated to last {limit} bytes]\n" + text[-limit:]
+
+
+def _decode(output: bytes) -> str:
+    """Decode subprocess output the way text=True would."""
+    return output.decode(errors='replace').replace('\r\n', '\n')
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    # Subprocess support on Windows requires the Proactor loop
+    loop = asyncio.ProactorEventLoop() if sys.platform == "win32" else asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+# Worker loop run by a persistent interpreter: one JSON request per line
+# on stdin, one JSON reply per line on the original stdout. Modules the
+# skill imports stay loaded between calls, which is where the saving is.
+_WORKER_SOURCE = r"""
+import io, json, runpy, sys, traceback
+script = sys.argv[1]
+requests, replies = sys.stdin, sys.stdout
+for line in requests:
+    out, err = io.StringIO(), io.StringIO()
+    sys.argv = [script] + json.loads(line)["args"]
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(), out, err
+    code = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
+        else:
+            err.write(f"{e.code}\n")
+            code = 1
+    except BaseException:
+        traceback.print_exc(file=err)
+        code = 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = requests, replies, sys.__stderr__
+    replies.write(json.dumps({"returncode": code, "stdout": out.getvalue(), "stderr": err.getvalue()}) + "\n")
+    replies.flush()
+"""
+
+
+class PersistentSkillRunner:
+    """
+    A warm Python interpreter dedicated to one skill script.
+    
+    Saves interpreter startup and the skill's imports on every call after
+    the first. Calls are serialized; a crashed or timed-out worker is
+    discarded and respawned on the next call.
+    """
+    
+    def __init__(self, script_path: str):
+        self.script_path = script_path
+        self.last_used = time.monotonic()
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def run(self, args: List[str], timeout: float) -> Tuple[int, str, str]:
+        """
+        Run the script once with the given argv.
+        
+        Returns:
+            (returncode, stdout, stderr)
+        
+        Raises:
+            asyncio.TimeoutError: If the call exceeds timeout
+        """
+        with self._lock:
+            self.last_used = time.monotonic()
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    [sys.executable, "-u", "-c", _WORKER_SOURCE, self.script_path],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    encoding="utf-8",
+                    env=_base_env(),
+                )
+            proc = self._proc
+            
+            # Kill the worker if the call overruns; readline then hits EOF
+            timed_out = threading.Event()
+            
+            def expire():
+                timed_out.set()
+                proc.kill()
+            
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+            try:
+                proc.stdin.write(json.dumps({"args": args}) + "\n")
+                proc.stdin.flush()
+                reply = proc.stdout.readline()
+            except OSError:
+                reply = ""
+            finally:
+                timer.cancel()
+            
+            if not reply:
+                self.close()
+                if timed_out.is_set():
+                    raise asyncio.TimeoutError()
+                raise RuntimeError("Persistent skill worker exited unexpectedly")
+            
+            result = json.loads(reply)
+            return result["returncode"], result["stdout"], result["stderr"]
+    
+    def close(self):
+        """Terminate the worker process, if any."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+_persistent_runners: Dict[str, PersistentSkillRunner] = {}
+_persistent_runners_lock = threading.Lock()
+
+
+def _get_persistent_runner(script_path: str) -> PersistentSkillRunner:
+    """Get (or start) the runner for a script, closing idle ones."""
+    now = time.monotonic()
+    with _persistent_runners_lock:
+        for path, runner in list(_persistent_runners.items()):
+            if path != script_path and now - runner.last_used > PERSISTENT_IDLE_TIMEOUT:
+                runner.close()
+                del _persistent_runners[path]
+        runner = _persistent_runners.get(script_path)
+        if runner is None:
+            runner = _persistent_runners[script_path] = PersistentSkillRunner(script_path)
+        return runner
+
+
+@atexit.register
+def _close_persistent_runners():
+    with _persistent_runners_lock:
+        for runner in _persistent_runners.values():
+            runner.close()
+        _persistent_runners.clear()
+
+
+class _SkillsEventHandler(FileSystemEventHandler):
+    """Forwards file-system events in the skills directory to the registry."""
+
+    def __init__(self, registry: "ScriptRegistry"):
+        super().__init__()
+        self._registry = registry
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._registry._update_script(Path(event.src_path))
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._registry._update_script(Path(event.src_path))
+
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._registry._remove_script(Path(event.src_path))
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._registry._remove_script(Path(event.src_path))
+            self._registry._update_script(Path(event.dest_path))
 
 
 class ScriptRegistry:
@@ -121,14 +466,87 @@ class ScriptRegistry:
     
     CRITICAL FLAW #6: Hot-reload complexity.
     Scripts added while server is running won't be detected.
-    MITIGATION: File watcher (watchdog) or periodic rescan (implemented).
+    MITIGATION: File watcher (watchdog) keeps the registry current after
+    one initial scan; without watchdog, a periodic rescan is used instead.
     """
     
     def __init__(self, skills_dir: Optional[Path] = None):
         self.skills_dir = skills_dir or (Path.home() / ".pai" / "skills")
+        self._skills_dir_str = str(self.skills_dir)  # resolved once, for scandir
         self._registry: Dict[str, ScriptExecutionTool] = {}
+        self._path_names: Dict[Path, str] = {}  # script path -> tool name
+        self._lock = threading.Lock()
+        self._metadata_cache_path = _metadata_cache_path(self.skills_dir)
+        self._metadata_cache: Dict[str, Dict[str, Any]] = self._load_metadata_cache()
+        self._metadata_cache_dirty = False
+        self._scan_executor: Optional[ThreadPoolExecutor] = None
         self._last_scan: float = 0
-        self._scan_interval: int = 60  # Rescan every 60s
+        self._scan_interval: int = 60  # Rescan every 60s (no watcher only)
+        self._observer = self._start_observer()
+        
+        # Warm start: serve the tools recorded by the last scan right away
+        # and revalidate them against the directory in the background
+        if self._restore_from_cache():
+            self._last_scan = time.time()
+            threading.Thread(
+                target=self._scan_skills, name="skills-revalidate", daemon=True
+            ).start()
+
+    def _restore_from_cache(self) -> bool:
+        """Rebuild the registry from the persisted metadata cache."""
+        registry: Dict[str, ScriptExecutionTool] = {}
+        path_names: Dict[Path, str] = {}
+        try:
+            for path, entry in self._metadata_cache.items():
+                # Only scripts that are still in this directory
+                if Path(path).parent != self.skills_dir or not os.path.isfile(path):
+                    continue
+                tool = ScriptExecutionTool(
+                    name=entry["name"],
+                    description=entry["description"],
+                    script_path=Path(path),
+                    persistent=entry["persistent"],
+                    large_output=entry["large_output"]
+                )
+                registry[tool.name] = tool
+                path_names[Path(path)] = tool.name
+        except Exception as e:
+            print(f"WARNING: Ignoring unreadable skills metadata cache: {e}")
+            return False
+        
+        if not registry:
+            return False
+        with self._lock:
+            self._registry = registry
+            self._path_names = path_names
+        return True
+
+    def _start_observer(self):
+        """Watch the skills directory for changes, if watchdog is available."""
+        if Observer is None or not self.skills_dir.is_dir():
+            return None
+
+        handler = _SkillsEventHandler(self)
+        # Native events first; polling covers WSL and network mounts
+        for observer_cls in (Observer, PollingObserver):
+            observer = observer_cls()
+            try:
+                observer.schedule(handler, self._skills_dir_str, recursive=False)
+                observer.daemon = True
+                observer.start()
+                return observer
+            except OSError as e:
+                print(f"WARNING: {observer_cls.__name__} unavailable for {self.skills_dir}: {e}")
+        return None
+
+    def close(self):
+        """Stop watching the skills directory and release scan threads."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        if self._scan_executor is not None:
+            self._scan_executor.shutdown(wait=False)
+            self._scan_executor = None
     
     def get_tools(self) -> List[BaseTool]:
         """
@@ -139,44 +557,184 @@ class ScriptRegistry:
         Returns:
             List of ScriptExecutionTool instances
         """
-        # Rescan if cache is stale
-        if time.time() - self._last_scan > self._scan_interval:
+        # With a watcher, only the cold-start scan is needed; events keep
+        # the registry current. Otherwise rescan when the cache is stale.
+        if self._observer is not None:
+            if not self._last_scan:
+                self._scan_skills()
+        elif time.time() - self._last_scan > self._scan_interval:
             self._scan_skills()
         
         return list(self._registry.values())
     
     def _scan_skills(self):
         """Scan skills directory and parse script metadata."""
-        skills_path = Path.home() / ".pai" / "skills"
+        skills_path = self.skills_dir
+        registry: Dict[str, ScriptExecutionTool] = {}
+        path_names: Dict[Path, str] = {}
         
-        if not skills_path.exists():
+        # Find all executable scripts (scandir yields name + stat together)
+        try:
+            with os.scandir(self._skills_dir_str) as entries:
+                candidates = [
+                    (Path(entry.path), entry.stat())
+                    for entry in entries
+                    if entry.is_file() and _is_script(entry.name, entry.stat())
+                ]
+        except FileNotFoundError:
             print(f"WARNING: Skills directory not found: {skills_path}")
+            with self._lock:
+                self._registry = {}
+                self._path_names = {}
             return
         
-        self._registry.clear()
+        # Parse in parallel (I/O-bound); collect in directory order so
+        # name collisions resolve the same way as a serial scan
+        with self._lock:
+            if self._scan_executor is None:
+                self._scan_executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="skills-scan",
+                )
+            executor = self._scan_executor
+        futures = [
+            (script_file, executor.submit(self._build_tool, script_file, st))
+            for script_file, st in candidates
+        ]
+        for script_file, future in futures:
+            error = future.exception()
+            if error is not None:
+                print(f"WARNING: Failed to parse {script_file}: {error}")
+                continue
+            tool = future.result()
+            registry[tool.name] = tool
+            path_names[script_file] = tool.name
         
-        # Find all executable scripts
-        for script_file in skills_path.glob("*"):
-            if script_file.is_file() and os.access(script_file, os.X_OK):
-                try:
-                    metadata = self._parse_script_metadata(script_file)
-                    
-                    # Create tool instance
-                    tool = ScriptExecutionTool(
-                        name=metadata.name,
-                        description=metadata.description,
-                        script_path=metadata.script_path
-                    )
-                    
-                    self._registry[metadata.name] = tool
-                    
-                except Exception as e:
-                    print(f"WARNING: Failed to parse {script_file}: {e}")
+        with self._lock:
+            self._registry = registry
+            self._path_names = path_names
+            # Forget scripts that no longer exist
+            live = {str(p) for p in path_names}
+            for key in [k for k in self._metadata_cache if k not in live]:
+                del self._metadata_cache[key]
+                self._metadata_cache_dirty = True
+        self._save_metadata_cache()
         
         self._last_scan = time.time()
         print(f"Loaded {len(self._registry)} script tools from {skills_path}")
+
+    def _build_tool(self, script_file: Path, st: Optional[os.stat_result] = None) -> ScriptExecutionTool:
+        """Create a tool instance from a script's metadata."""
+        metadata = self._parse_script_metadata(script_file, st)
+        return ScriptExecutionTool(
+            name=metadata.name,
+            description=metadata.description,
+            script_path=metadata.script_path,
+            persistent=metadata.persistent,
+            large_output=metadata.large_output
+        )
+
+    def _update_script(self, script_file: Path):
+        """Re-parse a single created or modified script."""
+        try:
+            st = script_file.stat()
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode) or not _is_script(script_file.name, st):
+            self._remove_script(script_file)
+            return
+        try:
+            tool = self._build_tool(script_file, st)
+        except Exception as e:
+            print(f"WARNING: Failed to parse {script_file}: {e}")
+            return
+        with self._lock:
+            old_name = self._path_names.get(script_file)
+            if old_name is not None and old_name != tool.name:
+                self._registry.pop(old_name, None)
+            self._registry[tool.name] = tool
+            self._path_names[script_file] = tool.name
+        self._save_metadata_cache()
+
+    def _remove_script(self, script_file: Path):
+        """Drop a deleted script from the registry."""
+        with self._lock:
+            name = self._path_names.pop(script_file, None)
+            if name is not None:
+                self._registry.pop(name, None)
     
-    def _parse_script_metadata(self, script_path: Path) -> ScriptMetadata:
+    def _load_metadata_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load this skills directory's persisted script metadata."""
+        try:
+            with open(self._metadata_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Entries written by an older parser may lack fields; start over.
+        # A file written for another directory (hash collision) is ignored.
+        if not isinstance(cache, dict) or cache.get("version") != METADATA_CACHE_VERSION:
+            return {}
+        if cache.get("skills_dir") != self._skills_dir_str:
+            return {}
+        scripts = cache.get("scripts")
+        return scripts if isinstance(scripts, dict) else {}
+
+    def _save_metadata_cache(self):
+        """Write the metadata cache atomically, if anything changed."""
+        with self._lock:
+            if not self._metadata_cache_dirty:
+                return
+            snapshot = json.dumps({
+                "version": METADATA_CACHE_VERSION,
+                "skills_dir": self._skills_dir_str,
+                "scripts": self._metadata_cache,
+            })
+            self._metadata_cache_dirty = False
+        cache_path = self._metadata_cache_path
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(snapshot)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"WARNING: Could not write metadata cache {cache_path}: {e}")
+
+    def _parse_script_metadata(self, script_path: Path, st: Optional[os.stat_result] = None) -> ScriptMetadata:
+        """
+        Get script metadata, re-parsing only when the file has changed.
+
+        Results are cached by (mtime_ns, size) in memory and in
+        this directory's file under METADATA_CACHE_DIR across restarts.
+        """
+        st = st or os.stat(script_path)
+        key = str(script_path)
+        cached = self._metadata_cache.get(key)
+        if cached and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+            return ScriptMetadata(
+                name=cached["name"],
+                description=cached["description"],
+                parameters=cached["parameters"],
+                script_path=script_path,
+                persistent=cached["persistent"],
+                large_output=cached["large_output"]
+            )
+
+        metadata = self._read_script_metadata(script_path)
+        with self._lock:
+            self._metadata_cache[key] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "name": metadata.name,
+                "description": metadata.description,
+                "parameters": metadata.parameters,
+                "persistent": metadata.persistent,
+                "large_output": metadata.large_output,
+            }
+            self._metadata_cache_dirty = True
+        return metadata
+
+    def _read_script_metadata(self, script_path: Path) -> ScriptMetadata:
         """
         Parse script docstring for metadata.
         
@@ -188,27 +746,33 @@ class ScriptRegistry:
         # PARAM: query (str) - The search query
         ```
         """
-        with open(script_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extract first comment block
-        lines = content.split('\n')[:20]  # Only check first 20 lines
+        # Extract first comment block; only the first 20 lines are read
+        with open(script_path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = list(islice(f, 20))
         
         name = script_path.stem  # Default to filename
         description = "No description provided"
         parameters = []
+        persistent = False
+        large_output = False
         
         for line in lines:
-            line = line.strip()
+            header = _HEADER_RE.match(line.strip())
+            if not header:
+                continue
             
-            if line.startswith('# NAME:'):
-                name = line.split(':', 1)[1].strip()
-            elif line.startswith('# DESCRIPTION:'):
-                description = line.split(':', 1)[1].strip()
-            elif line.startswith('# PARAM:'):
+            key, value = header.group(1), header.group(2).strip()
+            if key == 'NAME':
+                name = value
+            elif key == 'DESCRIPTION':
+                description = value
+            elif key == 'PERSISTENT':
+                persistent = value.lower() in ('true', 'yes', '1')
+            elif key == 'LARGE_OUTPUT':
+                large_output = value.lower() in ('true', 'yes', '1')
+            else:
                 # Parse: query (str) - The search query
-                param_str = line.split(':', 1)[1].strip()
-                match = re.match(r'(\w+)\s*\((\w+)\)\s*-\s*(.+)', param_str)
+                match = _PARAM_RE.match(value)
                 if match:
                     parameters.append({
                         "name": match.group(1),
@@ -220,5 +784,19 @@ class ScriptRegistry:
             name=name,
             description=description,
             parameters=parameters,
-            script_path=script_path
+            script_path=script_path,
+            persistent=persistent,
+            large_output=large_output
         )
+
+
+# Module-level shared registry, so one watcher serves every agent
+_script_registry: Optional[ScriptRegistry] = None
+
+
+def get_script_registry() -> ScriptRegistry:
+    """Get the shared script registry instance."""
+    global _script_registry
+    if _script_registry is None:
+        _script_registry = ScriptRegistry()
+    return _script_registry
@@ -1,43 +1,47 @@
 """Comprehensive audit of Life with AI Shared Drive folder structure."""
 import os
 import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from app.tools.google_clients import FOLDER_MIME, drive_service, list_drive_files
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
 
 # Shared Drive Configuration
 SHARED_DRIVE_ID = '0AMpJ2pkSpYq-Uk9PVA'  # Life with AI Shared Drive
 
-def get_all_files(service, folder_id=None, path=""):
-    """Recursively get all files and folders from Shared Drive."""
-    query = "trashed = false"
-    if folder_id:
-        query = f"'{folder_id}' in parents and trashed = false"
-    
-    results = service.files().list(
-        q=query,
-        corpora='drive',
-        driveId=SHARED_DRIVE_ID,
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True,
-        pageSize=100,
-        fields="files(id, name, mimeType, parents, modifiedTime, size)"
-    ).execute()
-    
-    items = results.get('files', [])
-    all_items = []
-    
+def get_all_files(service):
+    """Get all files and folders from the Shared Drive, with paths.
+
+    Lists the whole drive in a few paginated calls and rebuilds the
+    folder tree from each item's ``parents`` instead of issuing one
+    request per folder.
+    """
+    items = list_drive_files(service, SHARED_DRIVE_ID)
+    
+    # Group by parent; anything whose parent isn't a listed item is top-level
+    ids = {item['id'] for item in items}
+    children_by_parent = {}
+    roots = []
     for item in items:
+        parent = (item.get('parents') or [None])[0]
+        if parent in ids:
+            children_by_parent.setdefault(parent, []).append(item)
+        else:
+            roots.append(item)
+    
+    # Depth-first walk to assign paths (parents before their contents)
+    all_items = []
+    stack = [(item, "") for item in reversed(roots)]
+    while stack:
+        item, path = stack.pop()
         item['path'] = f"{path}/{item['name']}" if path else item['name']
         all_items.append(item)
-        
-        if item['mimeType'] == 'application/vnd.google-apps.folder':
-            # Recursively get contents
-            children = get_all_files(service, item['id'], item['path'])
-            all_items.extend(children)
+        if item['mimeType'] == FOLDER_MIME:
+            for child in reversed(children_by_parent.get(item['id'], [])):
+                stack.append((child, item['path']))
     
     return all_items
 
@@ -54,7 +58,7 @@ def print_tree(items):
             current = current[part]['__children']
         
         name = parts[-1]
-        is_folder = item['mimeType'] == 'application/vnd.google-apps.folder'
+        is_folder = item['mimeType'] == FOLDER_MIME
         icon = "📁" if is_folder else get_icon(item['mimeType'])
         current[name] = {
             '__info': f"{icon} {name}",
@@ -63,19 +67,45 @@ def print_tree(items):
             '__children': {} if is_folder else None
         }
     
-    def print_level(node, indent=0):
-        for key, value in sorted(node.items()):
-            if key.startswith('__'):
-                continue
-            info = value.get('__info', key)
-            print("  " * indent + info)
-            if value.get('__children'):
-                print_level(value['__children'], indent + 1)
-    
-    print_level(tree)
+    lines = list(iter_tree_lines(tree))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def iter_tree_lines(tree):
+    """Yield indented tree lines depth-first, without recursion."""
+    def entries(node, indent):
+        return [(key, value, indent) for key, value in sorted(node.items(), reverse=True)
+                if not key.startswith('__')]
+    
+    stack = entries(tree, 0)
+    while stack:
+        key, value, indent = stack.pop()
+        yield "  " * indent + value.get('__info', key)
+        if value.get('__children'):
+            stack.extend(entries(value['__children'], indent + 1))
+
+# Icons for the mime types a Drive audit mostly sees
+_MIME_ICON = {
+    'application/vnd.google-apps.document': "📄",
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': "📄",
+    'application/vnd.google-apps.spreadsheet': "📊",
+    'application/json': "📋",
+    'text/plain': "📝",
+    'text/markdown': "📝",
+    'image/png': "🖼️",
+    'image/jpeg': "🖼️",
+}
 
 def get_icon(mime_type):
     """Get icon for file type."""
+    icon = _MIME_ICON.get(mime_type)
+    if icon is None:
+        icon = _guess_icon(mime_type)
+    return icon
+
+@lru_cache(maxsize=64)
+def _guess_icon(mime_type):
+    """Fallback for mime types not in _MIME_ICON."""
     if 'document' in mime_type:
         return "📄"
     elif 'spreadsheet' in mime_type:
@@ -96,17 +126,16 @@ def main():
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
     creds_path = os.path.join(base_dir, "credentials.json")
-    creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    service = build('drive', 'v3', credentials=creds)
+    service = drive_service(tuple(SCOPES), creds_path)
     
     print("\n📂 Fetching all files and folders...\n")
     
-    # Get all files (no parent filter = all shared files)
+    # Get all files in the Shared Drive (flat listing, tree rebuilt locally)
     all_items = get_all_files(service)
     
     # Separate folders and files
-    folders = [i for i in all_items if i['mimeType'] == 'application/vnd.google-apps.folder']
-    files = [i for i in all_items if i['mimeType'] != 'application/vnd.google-apps.folder']
+    folders = [i for i in all_items if i['mimeType'] == FOLDER_MIME]
+    files = [i for i in all_items if i['mimeType'] != FOLDER_MIME]
     
     print(f"Total folders: {len(folders)}")
     print(f"Total files: {len(files)}")
@@ -115,10 +144,12 @@ def main():
     print("FOLDER STRUCTURE")
     print("=" * 70 + "\n")
     
-    # Print all folders
+    # Print all folders (buffered into a single write)
+    lines = []
     for folder in sorted(folders, key=lambda x: x['path']):
         depth = folder['path'].count('/')
-        print("  " * depth + f"📁 {folder['name']} [{folder['id'][:8]}...]")
+        lines.append("  " * depth + f"📁 {folder['name']} [{folder['id'][:8]}...]")
+    sys.stdout.write("".join(line + "\n" for line in lines))
     
     print("\n" + "=" * 70)
     print("ALL FILES BY FOLDER")
@@ -127,35 +158,30 @@ def main():
     # Group files by parent folder
     folder_map = {f['id']: f['name'] for f in folders}
     
-    files_by_folder = {}
+    files_by_folder = defaultdict(list)
     for file in files:
-        parent = file.get('parents', ['root'])[0] if file.get('parents') else 'root'
-        parent_name = folder_map.get(parent, 'Root')
-        if parent_name not in files_by_folder:
-            files_by_folder[parent_name] = []
-        files_by_folder[parent_name].append(file)
+        parent = (file.get('parents') or ['root'])[0]
+        files_by_folder[folder_map.get(parent, 'Root')].append(file)
     
+    lines = []
     for folder_name, folder_files in sorted(files_by_folder.items()):
-        print(f"\n📁 {folder_name}/")
+        lines.append(f"\n📁 {folder_name}/")
         for f in sorted(folder_files, key=lambda x: x['name']):
             icon = get_icon(f['mimeType'])
-            size = f.get('size', 'N/A')
-            print(f"   {icon} {f['name']}")
-            print(f"      ID: {f['id']}")
-            print(f"      Type: {f['mimeType']}")
+            lines.append(f"   {icon} {f['name']}")
+            lines.append(f"      ID: {f['id']}")
+            lines.append(f"      Type: {f['mimeType']}")
+    sys.stdout.write("".join(line + "\n" for line in lines))
     
     print("\n" + "=" * 70)
     print("SUMMARY")
     print("=" * 70)
     
     # Count by type
-    type_counts = {}
-    for f in files:
-        t = f['mimeType'].split('.')[-1] if '.' in f['mimeType'] else f['mimeType']
-        type_counts[t] = type_counts.get(t, 0) + 1
+    type_counts = Counter(f['mimeType'].rsplit('.', 1)[-1] for f in files)
     
     print("\nFiles by type:")
-    for t, count in sorted(type_counts.items(), key=lambda x: -x[1]):
+    for t, count in type_counts.most_common():
         print(f"  {t}: {count}")
 
 if __name__ == "__main__":
@@ -1,8 +1,7 @@
 
 import os
 import sys
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from app.tools.google_clients import docs_service
 
 SCOPES = ['https://www.googleapis.com/auth/documents']
 
@@ -11,8 +10,7 @@ def check_docs_api():
     creds_path = os.path.join(base_dir, "credentials.json")
     
     try:
-        creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-        service = build('docs', 'v1', credentials=creds)
+        service = docs_service(tuple(SCOPES), creds_path)
         
         # Try to creat a dummy doc to check API access
         print("Attempting to access Docs API...")
@@ -1,12 +1,7 @@
 """Find the correct folder ID for Life with AI."""
-from googleapiclient.discovery import build
-from google.oauth2.service_account import Credentials
+from app.tools.google_clients import DRIVE_SCOPE, drive_service
 
-creds = Credentials.from_service_account_file(
-    r'C:\Users\blues\.pai\skills\credentials.json',
-    scopes=['https://www.googleapis.com/auth/drive']
-)
-drive = build('drive', 'v3', credentials=creds)
+drive = drive_service((DRIVE_SCOPE,), r'C:\Users\blues\.pai\skills\credentials.json')
 
 # Search for Life with AI folder
 try:
@@ -17,6 +12,26 @@ try:
     
     folders = result.get('files', [])
     if folders:
+        # Fetch every folder's contents in batched round-trips
+        # (the Drive batch endpoint accepts up to 100 calls each)
+        contents_by_folder = {}
+        
+        def store_contents(request_id, response, exception):
+            contents_by_folder[request_id] = exception or response
+        
+        for start in range(0, len(folders), 100):
+            batch = drive.new_batch_http_request(callback=store_contents)
+            for f in folders[start:start + 100]:
+                batch.add(
+                    drive.files().list(
+                        q=f"'{f['id']}' in parents",
+                        pageSize=10,
+                        fields='files(id, name, mimeType)'
+                    ),
+                    request_id=f['id']
+                )
+            batch.execute()
+        
         print("Found folders:")
         for f in folders:
             print(f"  Name: {f['name']}")
@@ -26,11 +41,10 @@ try:
             
             # List contents of this folder
             print(f"  Contents of {f['name']}:")
-            contents = drive.files().list(
-                q=f"'{f['id']}' in parents",
-                pageSize=10,
-                fields='files(id, name, mimeType)'
-            ).execute()
+            contents = contents_by_folder.get(f['id'], {})
+            if isinstance(contents, Exception):
+                print(f"    Error: {contents}")
+                continue
             for c in contents.get('files', []):
                 print(f"    - {c['name']} ({c['mimeType']})")
     else:
@@ -5,8 +5,17 @@ Orchestrates the Scribe, Editor, and Guardian agents to produce content.
 Input: Topic + Target Google Doc ID
 Output: A fully drafted, reviewed, and compliance-checked story in the Google Doc.
 """
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import re
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from crewai import Agent, Task, Crew, Process
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -42,33 +51,149 @@ else:
 # Define Custom Tools via Wrapper
 from langchain.tools import tool
 
+from app.tools import google_clients
+from app.tools.google_exec import execute_with_retry
+
+# Docs API field masks behind read_doc's `view` choice; the agent picks a
+# view, never a raw mask. "text" asks only for paragraph text runs and
+# skips styles, lists, inline objects and revision data, which are most
+# of a full Document resource. Applied through our own Docs client, since
+# the story_writer skill's read_doc takes only a doc ID.
+DOC_VIEWS = {
+    "text": "title,body.content(paragraph(elements(textRun(content))))",
+    "structure": "title,body.content",
+}
+
+# Editor and Guardian both read the same draft, and identical passages
+# get style-checked again across docs in a session. Doc reads are reused
+# for a short TTL (dropped whenever the doc is appended to); style
+# results are kept per content digest.
+DOC_CACHE_TTL = 60  # seconds
+STYLE_CACHE_SIZE = 256
+STYLE_WORKERS = 4
+
+_doc_cache = {}  # (doc_id, view) -> (fetched_at, content)
+_style_cache = OrderedDict()  # blake2b digest -> check_text result
+_cache_lock = threading.Lock()
+
+# One long-lived pool for style checks. Threads, not processes: under
+# spawn (Windows) every worker process would re-import this script and
+# re-run its module-level setup, and a check is quick enough that the
+# pool start-up would outweigh it.
+_style_pool = ThreadPoolExecutor(max_workers=STYLE_WORKERS, thread_name_prefix="style-check")
+
+def _style_digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def _remember_style(digest, result):
+    with _cache_lock:
+        _style_cache[digest] = result
+        if len(_style_cache) > STYLE_CACHE_SIZE:
+            _style_cache.popitem(last=False)
+
+def batch_check(texts):
+    """
+    Style-check many passages, one result per text, in order.
+    
+    Cached passages are answered from the digest cache; the rest are
+    checked once per distinct passage on the shared style pool. A single
+    miss runs inline.
+    """
+    digests = [_style_digest(text) for text in texts]
+    results = [None] * len(texts)
+    misses = {}  # digest -> indexes of texts with that digest
+    with _cache_lock:
+        for i, digest in enumerate(digests):
+            if digest in _style_cache:
+                _style_cache.move_to_end(digest)
+                results[i] = _style_cache[digest]
+            else:
+                misses.setdefault(digest, []).append(i)
+    
+    if misses:
+        pending = [texts[indexes[0]] for indexes in misses.values()]
+        if len(pending) == 1:
+            checked = [style_checking.check_text(pending[0])]
+        else:
+            checked = list(_style_pool.map(style_checking.check_text, pending))
+        for (digest, indexes), result in zip(misses.items(), checked):
+            _remember_style(digest, result)
+            for i in indexes:
+                results[i] = result
+    return results
+
+def _fetch_doc(doc_id, view):
+    """Document title and text ("text"), or its title and body as JSON ("structure")."""
+    document = execute_with_retry(google_clients.docs_service().documents().get(
+        documentId=doc_id,
+        fields=DOC_VIEWS[view]
+    ))
+    title = document.get('title', 'Untitled')
+    content = document.get('body', {}).get('content', [])
+    if view == "structure":
+        return f"{title}\n\n{json.dumps(content, indent=1)}"
+    return f"{title}\n\n{''.join(google_clients.iter_text_runs(content))}"
+
+def _forget_doc(doc_id):
+    with _cache_lock:
+        for key in [key for key in _doc_cache if key[0] == doc_id]:
+            del _doc_cache[key]
+
 class EditorialTools:
     @tool("Read Document")
-    def read_doc(doc_id: str):
-        """Read the content of a Google Doc."""
-        return story_writer.read_doc(doc_id)
+    def read_doc(doc_id: str, view: str = "text", offset: int = 0, limit: int = 0):
+        """Read the content of a Google Doc. `view` is "text" (default: title and body text) or "structure" (full body, including tables and section breaks). Set `limit` to read only `limit` characters starting at `offset`; the reply then says where the next window starts."""
+        fields = DOC_VIEWS.get(view)
+        if fields is None:
+            return f"Error: unknown view '{view}'; use one of: {', '.join(DOC_VIEWS)}"
+        key = (doc_id, view)
+        with _cache_lock:
+            cached = _doc_cache.get(key)
+        if cached and time.monotonic() - cached[0] < DOC_CACHE_TTL:
+            content = cached[1]
+        else:
+            content = _fetch_doc(doc_id, view)
+            with _cache_lock:
+                _doc_cache[key] = (time.monotonic(), content)
+        if limit <= 0 and offset <= 0:
+            return content
+        end = offset + limit if limit > 0 else len(content)
+        window = content[offset:end]
+        if end < len(content):
+            return f"{window}\n[chars {offset}-{end} of {len(content)}; continue with offset={end}]"
+        return f"{window}\n[chars {offset}-{len(content)} of {len(content)}; end of document]"
 
     @tool("Append Text")
     def append_text(data: str):
         """Append text to a Google Doc. Input format: 'doc_id|content'."""
         try:
             doc_id, content = data.split("|", 1)
-            return story_writer.append_text(doc_id, content)
         except ValueError:
             return "Error: Input must be 'doc_id|content'"
+        _forget_doc(doc_id)
+        return story_writer.append_text(doc_id, content)
 
     @tool("Check Style")
     def check_style(text: str):
         """Check text against the Style Guide."""
-        return style_checking.check_text(text)
+        return batch_check([text])[0]
+
+    @tool("Check Style Passages")
+    def check_style_passages(data: str):
+        """Check several passages against the Style Guide in parallel. Separate passages with a line containing only '---'."""
+        passages = [p.strip() for p in re.split(r"^---$", data, flags=re.MULTILINE) if p.strip()]
+        results = batch_check(passages)
+        return "\n\n".join(f"Passage {i}:\n{result}" for i, result in enumerate(results, 1))
 
-# Helper to load prompts
+# Helper to load prompts (read once per process)
+@functools.lru_cache(maxsize=None)
 def load_prompt(role):
     path = os.path.expanduser(f"~/.pai/prompts/{role}.md")
-    if os.path.exists(path):
+    try:
         with open(path, "r", encoding="utf-8") as f:
             return f.read()
-    return f"You are the {role}."
+    except FileNotFoundError:
+        return f"You are the {role}."
 
 # --- AGENT DEFINITIONS ---
 # Using LiteLLM string format for robustness
@@ -98,7 +223,8 @@ guardian = Agent(
     role='The Guardian',
     goal='Ensure compliance with AI Mutualism and Style Guide.',
     backstory=load_prompt('guardian'),
-    tools=[EditorialTools.read_doc, EditorialTools.append_text, EditorialTools.check_style],
+    tools=[EditorialTools.read_doc, EditorialTools.append_text, EditorialTools.check_style,
+           EditorialTools.check_style_passages],
     llm=llm_model,
     verbose=True,
     allow_delegation=False
@@ -106,10 +232,9 @@ guardian = Agent(
 
 # --- TASK DEFINITIONS ---
 
-def create_crew(topic, doc_id):
-    
+def draft_task(topic, doc_id):
     # Task 1: Draft
-    task1 = Task(
+    return Task(
         description=f"""
         1. Read the document ({doc_id}) to see if there is existing content.
         2. If empty or minimal, write a draft about: '{topic}'.
@@ -120,8 +245,9 @@ def create_crew(topic, doc_id):
         expected_output="A drafted story appended to the Google Doc."
     )
 
+def edit_task(doc_id):
     # Task 2: Edit
-    task2 = Task(
+    return Task(
         description=f"""
         1. Read the document ({doc_id}) to review the Scribe's draft.
         2. Identify strengths and weaknesses.
@@ -131,8 +257,9 @@ def create_crew(topic, doc_id):
         expected_output="Editorial notes appended to the Google Doc."
     )
 
+def compliance_task(doc_id):
     # Task 3: Compliance
-    task3 = Task(
+    return Task(
         description=f"""
         1. Read the document ({doc_id}).
         2. Use the 'Check Style' tool on the content.
@@ -142,15 +269,75 @@ def create_crew(topic, doc_id):
         expected_output="Compliance report appended to the Google Doc."
     )
 
+def create_crew(topic, doc_id):
+    """Single sequential crew: Scribe -> Editor -> Guardian."""
     crew = Crew(
         agents=[scribe, editor, guardian],
-        tasks=[task1, task2, task3],
+        tasks=[draft_task(topic, doc_id), edit_task(doc_id), compliance_task(doc_id)],
         verbose=2,
         process=Process.sequential
     )
     
     return crew
 
+def _solo_crew(agent, task):
+    return Crew(agents=[agent], tasks=[task], verbose=2, process=Process.sequential)
+
+# Task graph for run_editorial: each task lists the tasks it needs first.
+# The reviews only read the Scribe's draft, so they run side by side.
+EDITORIAL_DAG = {
+    'draft': [],
+    'edit': ['draft'],
+    'compliance': ['draft'],
+}
+
+async def run_dag(crews, dag):
+    """
+    Run each crew as soon as the crews it depends on have finished.
+    
+    A crew's failure is recorded as its result rather than raised, so a
+    failed review doesn't cancel its sibling; crews that depend on a
+    failed one are skipped.
+    """
+    finished = {name: asyncio.Event() for name in crews}
+    results = {}
+    
+    async def run(name):
+        try:
+            for dep in dag[name]:
+                await finished[dep].wait()
+                if isinstance(results[dep], Exception):
+                    results[name] = RuntimeError(f"skipped because '{dep}' failed")
+                    return
+            results[name] = await crews[name].kickoff_async()
+        except Exception as e:
+            results[name] = e
+        finally:
+            finished[name].set()
+    
+    await asyncio.gather(*(run(name) for name in crews), return_exceptions=True)
+    return results
+
+async def run_editorial(topic, doc_id):
+    """
+    Fan-out/fan-in run of the same three tasks.
+    
+    The Editor and Guardian only read the Scribe's draft, so once the
+    draft is in the document they review it concurrently. Their sections
+    are appended in whichever order they finish.
+    """
+    crews = {
+        'draft': _solo_crew(scribe, draft_task(topic, doc_id)),
+        'edit': _solo_crew(editor, edit_task(doc_id)),
+        'compliance': _solo_crew(guardian, compliance_task(doc_id)),
+    }
+    results = await run_dag(crews, EDITORIAL_DAG)
+    return "\n\n".join(
+        f"!! {name} failed: {results[name]}" if isinstance(results[name], Exception)
+        else str(results[name])
+        for name in crews
+    )
+
 if __name__ == "__main__":
     if len(sys.argv) < 3:
         print("Usage: python editorial_crew.py <doc_id> <topic>")
@@ -163,8 +350,7 @@ if __name__ == "__main__":
     print(f"Topic: {topic}")
     print(f"Target Doc: {doc_id}")
     
-    crew = create_crew(topic, doc_id)
-    result = crew.kickoff()
+    result = asyncio.run(run_editorial(topic, doc_id))
     
     print("\n✅ Crew Finished!")
     print(result)
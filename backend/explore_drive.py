@@ -3,8 +3,9 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from collections import defaultdict
+
+from app.tools.google_clients import FOLDER_MIME, drive_service, list_drive_files
 
 SCOPES = ['https://www.googleapis.com/auth/drive', 'https://www.googleapis.com/auth/documents']
 
@@ -25,30 +26,21 @@ FOLDERS = {
     'workflows': '10NH-ufIi7PNNVL6SFW5ClgAJ5j2tM4iv',
 }
 
-def explore_folder(service, folder_name, folder_id, indent=0):
-    """List contents of a folder in Shared Drive."""
+def explore_folder(children, folder_name, folder_id, indent=0):
+    """List contents of a folder in Shared Drive.
+    
+    Walks the in-memory parent -> children index built in main(), so
+    nested folders cost no extra API calls.
+    """
     prefix = "  " * indent
     print(f"{prefix}📁 {folder_name}/")
     
-    results = service.files().list(
-        q=f"'{folder_id}' in parents and trashed = false",
-        corpora='drive',
-        driveId=SHARED_DRIVE_ID,
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True,
-        pageSize=20,
-        fields="files(id, name, mimeType)"
-    ).execute()
-    
-    items = results.get('files', [])
-    
-    for item in items:
-        if item['mimeType'] == 'application/vnd.google-apps.folder':
-            explore_folder(service, item['name'], item['id'], indent + 1)
+    for item in children.get(folder_id, []):
+        if item['mimeType'] == FOLDER_MIME:
+            explore_folder(children, item['name'], item['id'], indent + 1)
         elif item['mimeType'] == 'application/vnd.google-apps.document':
             print(f"{prefix}  📄 {item['name']}")
         else:
-            ext = item['name'].split('.')[-1] if '.' in item['name'] else 'file'
             print(f"{prefix}  📎 {item['name']}")
 
 def main():
@@ -58,13 +50,18 @@ def main():
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
     creds_path = os.path.join(base_dir, "credentials.json")
-    creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    service = build('drive', 'v3', credentials=creds)
+    service = drive_service(tuple(SCOPES), creds_path)
+    
+    # Fetch the whole drive once and index it by parent
+    children = defaultdict(list)
+    for item in list_drive_files(service, SHARED_DRIVE_ID):
+        if item.get('parents'):
+            children[item['parents'][0]].append(item)
     
     # Explore key folders
     for folder_name in ['in_development', 'ready_for_review', 'reference_docs', 'agent_prompts']:
         if folder_name in FOLDERS:
-            explore_folder(service, folder_name.replace('_', ' ').title(), FOLDERS[folder_name])
+            explore_folder(children, folder_name.replace('_', ' ').title(), FOLDERS[folder_name])
             print()
 
 if __name__ == "__main__":
@@ -1,14 +1,31 @@
 """
 Librarian: Comprehensive Drive Organization
 Moves all documents to appropriate folders, checks for empty/redundant folders.
+
+Runs after the first only look at files changed since the previous run
+(Drive change feed); pass --full to force a complete sweep.
 """
+import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from collections import defaultdict
+from collections import Counter
+
+from app.tools.google_clients import (
+    FOLDER_MIME,
+    drive_service,
+    get_credentials,
+    get_drive_changes,
+    get_start_page_token,
+    iter_drive_files,
+    thread_http,
+)
+from app.tools.google_exec import backoff_delay, execute_with_retry, is_retryable
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
 
@@ -36,87 +53,177 @@ FOLDERS = {
 moves_made = []
 empty_folders = []
 all_folders = {}
-all_files = []
 
-def get_all_items(service):
-    """Get all files and folders from Shared Drive."""
-    items = []
-    page_token = None
-    
-    while True:
-        results = service.files().list(
-            q="trashed = false",
-            corpora='drive',
-            driveId=SHARED_DRIVE_ID,
-            includeItemsFromAllDrives=True,
-            supportsAllDrives=True,
-            pageSize=200,
-            fields="nextPageToken, files(id, name, mimeType, parents)",
-            pageToken=page_token
-        ).execute()
-        
-        items.extend(results.get('files', []))
-        page_token = results.get('nextPageToken')
-        if not page_token:
-            break
-    
-    return items
+# Change-feed position between runs; without it (or with --full, or once
+# FULL_SWEEP_INTERVAL has passed) the whole drive is scanned.
+STATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".organize_state.json")
+FULL_SWEEP_INTERVAL = 7 * 24 * 60 * 60  # seconds
+
+def iter_all_items(service):
+    """Yield all files and folders from Shared Drive as pages arrive."""
+    return iter_drive_files(service, SHARED_DRIVE_ID)
 
-def move_file(service, file_id, old_parent, new_parent, file_name, reason):
-    """Move a file to a new folder on Shared Drive."""
+def iter_changed_items(service, page_token, state):
+    """Yield every folder plus the files changed since ``page_token``.
+
+    Folders are always listed in full (they are few, and needed to
+    resolve target folders and names); files come from the change feed.
+    The token to resume from is stored in ``state['page_token']``.
+    """
+    yield from iter_drive_files(
+        service, SHARED_DRIVE_ID, query=f"mimeType = '{FOLDER_MIME}' and trashed = false"
+    )
+    changed, state['page_token'] = get_drive_changes(service, SHARED_DRIVE_ID, page_token)
+    for item in changed:
+        if item['mimeType'] != FOLDER_MIME:
+            yield item
+
+def load_state():
+    """Saved change-feed state from the last run, or {} if there is none."""
     try:
-        service.files().update(
-            fileId=file_id,
-            addParents=new_parent,
-            removeParents=old_parent,
-            supportsAllDrives=True,
-            fields='id, parents'
-        ).execute()
-        
-        old_name = all_folders.get(old_parent, 'Root')
-        new_name = all_folders.get(new_parent, 'Unknown')
-        
-        moves_made.append({
-            'file': file_name,
-            'from': old_name,
-            'to': new_name,
-            'reason': reason
-        })
-        print(f"   ✅ Moved: {file_name}")
-        print(f"      {old_name} → {new_name}")
-        return True
-    except Exception as e:
-        print(f"   ❌ Failed: {file_name} - {e}")
-        return False
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_state(state):
+    """Persist change-feed state for the next run (atomic replace)."""
+    tmp_path = STATE_FILE + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, STATE_FILE)
+
+# Drive's batch endpoint accepts at most 100 calls per request
+BATCH_LIMIT = 100
+
+# Batches in flight at once, and retries for rate-limited moves
+MOVE_WORKERS = 10
+MOVE_RETRIES = 5
+
+_report_lock = threading.Lock()
+
+def _move_batch(service, creds, moves, indices):
+    """Send one batch of moves, re-sending rate-limited ones with jittered backoff.
+
+    Requests are built from the shared service but sent over this
+    worker's own persistent connection (see thread_http).
+    """
+    http = thread_http(creds)
+
+    for attempt in range(MOVE_RETRIES + 1):
+        throttled = []
+
+        def on_move_done(request_id, response, exception):
+            i = int(request_id)
+            move = moves[i]
+            if exception is not None:
+                if is_retryable(exception, idempotent=False) and attempt < MOVE_RETRIES:
+                    throttled.append(i)
+                    return
+                with _report_lock:
+                    print(f"   ❌ Failed: {move['file_name']} - {exception}")
+                return
+
+            old_name = all_folders.get(move['old_parent'], 'Root')
+            new_name = all_folders.get(move['new_parent'], 'Unknown')
+
+            move['moved'] = True
+            with _report_lock:
+                moves_made.append({
+                    'file': move['file_name'],
+                    'from': old_name,
+                    'to': new_name,
+                    'reason': move['reason']
+                })
+                print(f"   ✅ Moved: {move['file_name']}")
+                print(f"      {old_name} → {new_name}")
+
+        batch = service.new_batch_http_request(callback=on_move_done)
+        for i in indices:
+            move = moves[i]
+            batch.add(
+                service.files().update(
+                    fileId=move['file_id'],
+                    addParents=move['new_parent'],
+                    removeParents=move['old_parent'],
+                    supportsAllDrives=True,
+                    fields='id'
+                ),
+                request_id=str(i)
+            )
+        execute_with_retry(batch, idempotent=False, http=http)
+
+        if not throttled:
+            return
+        indices = throttled
+        time.sleep(backoff_delay(attempt))
+
+def move_files(service, creds, moves):
+    """Move files to new folders on Shared Drive.
+
+    Each move is a dict with file_id, old_parent, new_parent, file_name
+    and reason. Moves are grouped into batches of up to BATCH_LIMIT
+    updates and up to MOVE_WORKERS batches are in flight at once. Moves
+    refused with a rate limit are re-sent with jittered exponential
+    backoff; a 5xx is reported, not retried, since the move may already
+    have happened (see app.tools.google_exec).
+    """
+    with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+        futures = {}
+        for start in range(0, len(moves), BATCH_LIMIT):
+            indices = list(range(start, min(start + BATCH_LIMIT, len(moves))))
+            futures[executor.submit(_move_batch, service, creds, moves, indices)] = len(indices)
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                with _report_lock:
+                    print(f"   ❌ Batch of {futures[future]} moves failed - {e}")
+
+# Every keyword categorize_file looks for. The pattern is a zero-width
+# lookahead, so one findall reports each keyword wherever it starts
+# (overlapping ones included, and no keyword is a prefix of another).
+CATEGORY_KEYWORDS = (
+    'character', 'profile', 'voice', 'template', 'style', 'guide',
+    'editor', 'copy', 'polish', 'scalpel', 'line-editor',
+    'blog post', 'screenshot', 'workflow',
+    'economic', 'timeline', 'evolution', 'realistic', 'infrastructure',
+)
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, CATEGORY_KEYWORDS)) + '))')
+
+CHARACTER_WORDS = frozenset({'character', 'profile'})
+STYLE_WORDS = frozenset({'style', 'guide'})
+PROMPT_WORDS = frozenset({'editor', 'copy', 'polish', 'scalpel', 'line-editor'})
+BLOG_IMAGE_WORDS = frozenset({'blog post', 'screenshot'})
+WORLD_WORDS = frozenset({'economic', 'timeline', 'evolution', 'realistic', 'infrastructure'})
 
 def categorize_file(name, mime_type):
     """Determine where a file should go based on name and type."""
-    name_lower = name.lower()
+    found = set(_KEYWORD_RE.findall(name.lower()))
     
     # Character profiles
-    if 'character' in name_lower or 'profile' in name_lower:
-        if 'voice' in name_lower:
+    if found & CHARACTER_WORDS:
+        if 'voice' in found:
             return 'Voice_Library', 'Voice profile'
         return 'Characters', 'Character profile'
     
     # Voice/style files
-    if 'voice' in name_lower and 'template' not in name_lower:
+    if 'voice' in found and 'template' not in found:
         return 'Voice_Library', 'Voice sample'
     
     # Style guides and templates
-    if 'style' in name_lower or 'guide' in name_lower:
+    if found & STYLE_WORDS:
         return 'Style_Guides', 'Style guide'
-    if 'editor' in name_lower or 'copy' in name_lower or 'polish' in name_lower:
+    if found & PROMPT_WORDS:
         return 'Agent_Prompts', 'Agent prompt'
-    if 'scalpel' in name_lower or 'line-editor' in name_lower:
-        return 'Agent_Prompts', 'Agent prompt'
-    if 'template' in name_lower:
+    if 'template' in found:
         return 'Agent_Prompts', 'Template'
     
     # Images
     if mime_type.startswith('image/'):
         return 'Assets', 'Image file'
-    if 'blog post' in name_lower or 'screenshot' in name_lower:
+    if found & BLOG_IMAGE_WORDS:
         return 'Assets', 'Blog image'
     
     # PDFs - likely research
@@ -124,31 +231,26 @@ def categorize_file(name, mime_type):
         return 'Reference_Docs', 'PDF document'
     
     # Workflow files
-    if 'workflow' in name_lower or mime_type == 'application/json':
+    if 'workflow' in found or mime_type == 'application/json':
         return 'Workflows', 'Workflow file'
     
     # World-building content
-    if any(x in name_lower for x in ['economic', 'timeline', 'evolution', 'realistic', 'infrastructure']):
+    if found & WORLD_WORDS:
         return 'World', 'World-building'
     
     return None, None  # Don't move if unsure
 
-def check_empty_folders(service, all_items):
-    """Check for empty folders."""
-    folder_contents = defaultdict(list)
-    
-    for item in all_items:
-        if item.get('parents'):
-            for parent in item['parents']:
-                folder_contents[parent].append(item['name'])
-    
-    folders = [i for i in all_items if i['mimeType'] == 'application/vnd.google-apps.folder']
-    
-    for folder in folders:
-        if folder['id'] not in folder_contents:
+def check_empty_folders(child_counts):
+    """Check for empty folders.
+
+    Walks ``all_folders``; ``child_counts`` maps each folder ID to the
+    number of items listing it as a parent.
+    """
+    for folder_id, folder_name in all_folders.items():
+        if not child_counts.get(folder_id):
             empty_folders.append({
-                'name': folder['name'],
-                'id': folder['id']
+                'name': folder_name,
+                'id': folder_id
             })
 
 def main():
@@ -158,22 +260,53 @@ def main():
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
     creds_path = os.path.join(base_dir, "credentials.json")
-    creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    service = build('drive', 'v3', credentials=creds)
+    creds = get_credentials(tuple(SCOPES), creds_path)
+    service = drive_service(tuple(SCOPES), creds_path)
     
-    print("\n📂 Fetching all files and folders...")
-    all_items = get_all_items(service)
+    state = load_state()
+    full_sweep = (
+        '--full' in sys.argv
+        or 'page_token' not in state
+        or time.time() - state.get('last_full_sweep', 0) > FULL_SWEEP_INTERVAL
+    )
     
-    # Build folder map
-    for item in all_items:
-        if item['mimeType'] == 'application/vnd.google-apps.folder':
-            all_folders[item['id']] = item['name']
+    if full_sweep:
+        print("\n📂 Fetching all files and folders...")
+        # Take the change-feed position first so edits made during the
+        # sweep are picked up by the next incremental run
+        new_state = {'page_token': get_start_page_token(service, SHARED_DRIVE_ID),
+                     'last_full_sweep': time.time()}
+        items = iter_all_items(service)
+    else:
+        print("\n📂 Fetching folders and files changed since the last run...")
+        new_state = {'last_full_sweep': state['last_full_sweep']}
+        items = iter_changed_items(service, state['page_token'], new_state)
     
-    # Separate files from folders
-    files = [i for i in all_items if i['mimeType'] != 'application/vnd.google-apps.folder']
-    folders = [i for i in all_items if i['mimeType'] == 'application/vnd.google-apps.folder']
+    # One streaming pass: build the folder map, count children per folder
+    # and classify files as pages arrive. Only files with a destination
+    # are kept for the move step.
+    name_to_id = {}
+    child_counts = Counter()
+    candidates = []
+    file_count = 0
+    for item in items:
+        for parent in item.get('parents', []):
+            child_counts[parent] += 1
+        
+        if item['mimeType'] == FOLDER_MIME:
+            all_folders[item['id']] = item['name']
+            name_to_id[item['name']] = item['id']
+            continue
+        
+        file_count += 1
+        target_folder, reason = categorize_file(item['name'], item['mimeType'])
+        if target_folder:
+            candidates.append((item, target_folder, reason))
     
-    print(f"   Found {len(files)} files and {len(folders)} folders")
+    if full_sweep:
+        print(f"   Found {file_count} files and {len(all_folders)} folders")
+    else:
+        print(f"   Found {file_count} changed files and {len(all_folders)} folders")
     
     # ========================================
     # STEP 1: Move files to appropriate folders
@@ -182,26 +315,17 @@ def main():
     print("STEP 1: ORGANIZING FILES")
     print("=" * 70)
     
-    # Get target folder IDs
-    target_folders = {}
-    for item in all_items:
-        if item['mimeType'] == 'application/vnd.google-apps.folder':
-            target_folders[item['name']] = item['id']
-    
-    # Update FOLDERS with discovered IDs
-    FOLDERS.update(target_folders)
+    # Update FOLDERS with discovered IDs (target folders by name)
+    FOLDERS.update(name_to_id)
     
-    # Process files
-    for file in files:
+    # Process files (moves are collected, then sent in batches)
+    pending_moves = []
+    for file, target_folder, reason in candidates:
         name = file['name']
-        mime = file['mimeType']
         current_parent = file.get('parents', [None])[0]
         current_folder_name = all_folders.get(current_parent, 'Root')
         
-        # Determine target folder
-        target_folder, reason = categorize_file(name, mime)
-        
-        if target_folder and target_folder in FOLDERS:
+        if target_folder in FOLDERS:
             target_id = FOLDERS[target_folder]
             
             # Only move if not already there
@@ -211,7 +335,17 @@ def main():
                 print(f"   Should be in: {target_folder} ({reason})")
                 
                 if current_parent:
-                    move_file(service, file['id'], current_parent, target_id, name, reason)
+                    pending_moves.append({
+                        'file_id': file['id'],
+                        'old_parent': current_parent,
+                        'new_parent': target_id,
+                        'file_name': name,
+                        'reason': reason
+                    })
+    
+    if pending_moves:
+        print(f"\n🚚 Moving {len(pending_moves)} files...")
+        move_files(service, creds, pending_moves)
     
     # ========================================
     # STEP 2: Check for empty folders
@@ -220,11 +354,17 @@ def main():
     print("STEP 2: CHECKING FOR EMPTY FOLDERS")
     print("=" * 70)
     
-    # Re-fetch to get updated structure
-    all_items_updated = get_all_items(service)
-    check_empty_folders(service, all_items_updated)
+    if full_sweep:
+        # Apply completed moves to the child counts instead of re-fetching
+        for move in pending_moves:
+            if move.get('moved'):
+                child_counts[move['old_parent']] -= 1
+                child_counts[move['new_parent']] += 1
+        check_empty_folders(child_counts)
     
-    if empty_folders:
+    if not full_sweep:
+        print("\n⏭️  Skipped on incremental runs (runs with each full sweep, or pass --full)")
+    elif empty_folders:
         print("\n⚠️  Empty folders found (you may want to delete):")
         for folder in empty_folders:
             print(f"   📁 {folder['name']} (ID: {folder['id']})")
@@ -253,13 +393,22 @@ def main():
     print("\n" + "=" * 70)
     print("EMPTY FOLDERS (for manual review)")
     print("=" * 70)
-    if empty_folders:
+    if not full_sweep:
+        print("   Not checked (incremental run)")
+    elif empty_folders:
         for folder in empty_folders:
             print(f"   📁 {folder['name']}")
             print(f"      ID: {folder['id']}")
     else:
         print("   None found")
     
+    # Only advance the change feed once every move has landed; otherwise
+    # the next run starts from the old position and retries the failures
+    failed_moves = [move for move in pending_moves if not move.get('moved')]
+    if failed_moves:
+        print(f"\n⚠️  {len(failed_moves)} move(s) failed; change-feed position not saved, next run will retry them")
+    else:
+        save_state(new_state)
     print("\n✅ Organization complete!")
 
 if __name__ == "__main__":
@@ -3,10 +3,10 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
-import io
+import tempfile
+
+from app.tools.google_clients import drive_service
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
 
@@ -16,18 +16,30 @@ FILES = {
     'Atlas (Continuity)': '17M2T7jR6Mo0u7XPcV96H8njSjxdnhoAl',
 }
 
+# Download in 8 MiB pieces; files up to 1 MiB stay in memory, larger ones
+# spill to a temporary file instead of growing a BytesIO
+DOWNLOAD_CHUNK = 8 * 1024 * 1024
+SPOOL_MAX = 1 << 20
+
+def iter_file_lines(service, file_id):
+    """Download a text file from Drive and yield its decoded lines."""
+    request = service.files().get_media(fileId=file_id)
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX) as file_content:
+        downloader = MediaIoBaseDownload(file_content, request, chunksize=DOWNLOAD_CHUNK)
+        
+        done = False
+        while not done:
+            status, done = downloader.next_chunk()
+        
+        file_content.seek(0)
+        # Split on b"\n" and decode each line as-is: UTF-8 never has a
+        # newline byte inside a character, and "\r\n" endings are kept
+        for line in file_content:
+            yield line.decode('utf-8')
+
 def read_file_content(service, file_id, file_name):
     """Download and read a text file from Drive."""
-    request = service.files().get_media(fileId=file_id)
-    file_content = io.BytesIO()
-    downloader = MediaIoBaseDownload(file_content, request)
-    
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
-    
-    content = file_content.getvalue().decode('utf-8')
-    return content
+    return "".join(iter_file_lines(service, file_id))
 
 def main():
     print("=" * 60)
@@ -36,16 +48,17 @@ def main():
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
     creds_path = os.path.join(base_dir, "credentials.json")
-    creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    service = build('drive', 'v3', credentials=creds)
+    service = drive_service(tuple(SCOPES), creds_path)
     
     for name, file_id in FILES.items():
         print(f"\n{'='*60}")
         print(f"📄 {name}")
         print("=" * 60)
         try:
-            content = read_file_content(service, file_id, name)
-            print(content)
+            # Stream straight to stdout rather than holding the whole file
+            for line in iter_file_lines(service, file_id):
+                sys.stdout.write(line)
+            print()
         except Exception as e:
             print(f"Error reading {name}: {e}")
 
@@ -4,10 +4,15 @@ Creates missing folders and moves files to proper locations.
 """
 import os
 import sys
+import time
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from app.tools.google_clients import (
+    cached_folder_id,
+    drive_service,
+    remember_folder_id,
+)
+from app.tools.google_exec import backoff_delay, is_retryable
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
 
@@ -38,49 +43,137 @@ FILES_TO_MOVE = {
     'Arun_Pichai_Character_Profile': '1-CD--k0kuVKMsJe0mX4xR-bhCmMmU28U-smIPHpTTK0',
 }
 
-def create_folder(service, name, parent_id):
-    """Create a folder in Drive."""
-    file_metadata = {
-        'name': name,
-        'mimeType': 'application/vnd.google-apps.folder',
-        'parents': [parent_id]
-    }
-    folder = service.files().create(body=file_metadata, fields='id, name').execute()
-    print(f"✅ Created folder: {name} (ID: {folder['id']})")
-    return folder['id']
+# Drive's batch endpoint accepts at most 100 calls per request
+BATCH_LIMIT = 100
 
-def move_file(service, file_id, old_parent_id, new_parent_id, file_name):
-    """Move a file from one folder to another."""
-    try:
-        # Update the file's parents
-        service.files().update(
-            fileId=file_id,
-            addParents=new_parent_id,
-            removeParents=old_parent_id,
-            fields='id, parents'
-        ).execute()
-        print(f"✅ Moved: {file_name} → new folder")
-        return True
-    except Exception as e:
-        print(f"❌ Failed to move {file_name}: {e}")
-        return False
+# Times a rate-limited move is re-sent before giving up
+MOVE_RETRIES = 5
 
-def get_file_parent(service, file_id):
-    """Get the parent folder ID of a file."""
-    try:
-        file = service.files().get(fileId=file_id, fields='parents').execute()
-        return file.get('parents', [None])[0]
-    except:
-        return None
+def create_folders(service, folders):
+    """Create folders in Drive, batched. ``folders`` maps name -> parent ID; returns name -> new ID."""
+    created = {}
+    
+    def on_created(request_id, response, exception):
+        if exception is None:
+            created[request_id] = response['id']
+            remember_folder_id(folders[request_id], request_id, response['id'])
+            print(f"✅ Created folder: {request_id} (ID: {response['id']})")
+        else:
+            print(f"❌ Failed to create folder {request_id}: {exception}")
+    
+    names = list(folders)
+    for start in range(0, len(names), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_created)
+        for name in names[start:start + BATCH_LIMIT]:
+            file_metadata = {
+                'name': name,
+                'mimeType': 'application/vnd.google-apps.folder',
+                'parents': [folders[name]]
+            }
+            batch.add(
+                service.files().create(body=file_metadata, supportsAllDrives=True, fields='id'),
+                request_id=name
+            )
+        batch.execute()
+    return created
+
+def get_file_parents(service, file_ids):
+    """Get the parent folder ID of each file, batched into one round-trip per 100 files."""
+    parents_by_id = {}
+    
+    def on_parents(request_id, response, exception):
+        if exception is None:
+            parents_by_id[request_id] = response.get('parents', [None])[0]
+    
+    for start in range(0, len(file_ids), BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=on_parents)
+        for file_id in file_ids[start:start + BATCH_LIMIT]:
+            batch.add(
+                service.files().get(fileId=file_id, supportsAllDrives=True, fields='parents'),
+                request_id=file_id
+            )
+        batch.execute()
+    return parents_by_id
+
+def move_files(service, moves):
+    """Move files between folders, batched. Each move is (file_id, old_parent_id, new_parent_id, file_name).
+    
+    Moves refused with a rate limit are re-sent on their own after a
+    jittered backoff; the rest of the batch is not repeated. A 5xx is
+    reported rather than retried, since the move may already have happened.
+    """
+    names = {file_id: file_name for file_id, _, _, file_name in moves}
+    
+    for start in range(0, len(moves), BATCH_LIMIT):
+        pending = moves[start:start + BATCH_LIMIT]
+        for attempt in range(MOVE_RETRIES + 1):
+            throttled = set()
+    
+            def on_moved(request_id, response, exception):
+                if exception is None:
+                    print(f"✅ Moved: {names[request_id]} → new folder")
+                elif is_retryable(exception, idempotent=False) and attempt < MOVE_RETRIES:
+                    throttled.add(request_id)
+                else:
+                    print(f"❌ Failed to move {names[request_id]}: {exception}")
+    
+            batch = service.new_batch_http_request(callback=on_moved)
+            for file_id, old_parent_id, new_parent_id, _ in pending:
+                batch.add(
+                    service.files().update(
+                        fileId=file_id,
+                        addParents=new_parent_id,
+                        removeParents=old_parent_id,
+                        supportsAllDrives=True,
+                        fields='id'
+                    ),
+                    request_id=file_id
+                )
+            batch.execute()
+    
+            if not throttled:
+                break
+            pending = [move for move in pending if move[0] in throttled]
+            time.sleep(backoff_delay(attempt))
+
+def find_folders(service, wanted):
+    """Look up several folders in one files.list call.
 
-def folder_exists(service, name, parent_id):
-    """Check if a folder exists."""
-    query = f"name = '{name}' and '{parent_id}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-    results = service.files().list(q=query, fields="files(id, name)").execute()
-    files = results.get('files', [])
-    if files:
-        return files[0]['id']
-    return None
+    ``wanted`` maps folder name -> parent ID. Returns name -> folder ID
+    for the ones that exist. IDs seen on earlier runs are reused, so
+    only the rest are queried.
+    """
+    found = {}
+    for name, parent_id in wanted.items():
+        folder_id = cached_folder_id(parent_id, name)
+        if folder_id:
+            found[name] = folder_id
+    wanted = {name: parent_id for name, parent_id in wanted.items() if name not in found}
+    if not wanted:
+        return found
+    
+    parents = sorted(set(wanted.values()))
+    parent_clause = " or ".join(f"'{parent_id}' in parents" for parent_id in parents)
+    name_clause = " or ".join(f"name = '{name}'" for name in wanted)
+    query = (
+        f"({parent_clause}) and ({name_clause}) "
+        "and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
+    )
+    results = service.files().list(
+        q=query,
+        corpora='drive',
+        driveId=SHARED_DRIVE_ID,
+        includeItemsFromAllDrives=True,
+        supportsAllDrives=True,
+        fields="files(id, name, parents)"
+    ).execute()
+    
+    for folder in results.get('files', []):
+        name = folder['name']
+        if name not in found and wanted.get(name) in folder.get('parents', []):
+            found[name] = folder['id']
+            remember_folder_id(wanted[name], name, folder['id'])
+    return found
 
 def main():
     print("=" * 70)
@@ -89,8 +182,7 @@ def main():
     
     base_dir = os.path.dirname(os.path.abspath(__file__))
     creds_path = os.path.join(base_dir, "credentials.json")
-    creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    service = build('drive', 'v3', credentials=creds)
+    service = drive_service(tuple(SCOPES), creds_path)
     
     # ========================================
     # STEP 1: Create missing folders
@@ -99,41 +191,30 @@ def main():
     
     new_folders = {}
     
-    # Create Characters folder under Reference_Docs
+    # Folders to ensure, by name -> parent
+    wanted = {}
+    
+    # Characters, Style_Guides and World go under Reference_Docs
     ref_docs_id = FOLDERS.get('Reference_Docs')
     if ref_docs_id:
-        existing = folder_exists(service, 'Characters', ref_docs_id)
-        if existing:
-            new_folders['Characters'] = existing
-            print(f"   📁 Characters already exists (ID: {existing})")
-        else:
-            new_folders['Characters'] = create_folder(service, 'Characters', ref_docs_id)
-        
-        # Create Style_Guides folder
-        existing = folder_exists(service, 'Style_Guides', ref_docs_id)
-        if existing:
-            new_folders['Style_Guides'] = existing
-            print(f"   📁 Style_Guides already exists (ID: {existing})")
-        else:
-            new_folders['Style_Guides'] = create_folder(service, 'Style_Guides', ref_docs_id)
-        
-        # Create World folder
-        existing = folder_exists(service, 'World', ref_docs_id)
-        if existing:
-            new_folders['World'] = existing
-            print(f"   📁 World already exists (ID: {existing})")
-        else:
-            new_folders['World'] = create_folder(service, 'World', ref_docs_id)
+        for name in ('Characters', 'Style_Guides', 'World'):
+            wanted[name] = ref_docs_id
     
-    # Create Assets folder under Life with AI root
+    # Assets goes under Life with AI root
     life_with_ai_id = FOLDERS.get('Life with AI')
     if life_with_ai_id:
-        existing = folder_exists(service, 'Assets', life_with_ai_id)
-        if existing:
-            new_folders['Assets'] = existing
-            print(f"   📁 Assets already exists (ID: {existing})")
-        else:
-            new_folders['Assets'] = create_folder(service, 'Assets', life_with_ai_id)
+        wanted['Assets'] = life_with_ai_id
+    
+    # One lookup for all of them; create only the ones that are missing
+    existing = find_folders(service, wanted) if wanted else {}
+    for name in wanted:
+        if name in existing:
+            new_folders[name] = existing[name]
+            print(f"   📁 {name} already exists (ID: {existing[name]})")
+    
+    missing = {name: parent_id for name, parent_id in wanted.items() if name not in existing}
+    if missing:
+        new_folders.update(create_folders(service, missing))
     
     # ========================================
     # STEP 2: Move character profiles
@@ -142,12 +223,17 @@ def main():
     
     characters_folder_id = new_folders.get('Characters')
     if characters_folder_id:
+        # One batched lookup for every file's parent, then one batch of moves
+        parents_by_id = get_file_parents(service, list(FILES_TO_MOVE.values()))
+        moves = []
         for file_name, file_id in FILES_TO_MOVE.items():
-            old_parent = get_file_parent(service, file_id)
+            old_parent = parents_by_id.get(file_id)
             if old_parent:
-                move_file(service, file_id, old_parent, characters_folder_id, file_name)
+                moves.append((file_id, old_parent, characters_folder_id, file_name))
             else:
                 print(f"   ⚠️ Could not find parent for {file_name}")
+        if moves:
+            move_files(service, moves)
     
     # ========================================
     # STEP 3: Summary
@@ -6,7 +6,10 @@ This script ensures UTF-8 encoding is configured before any other
 modules are imported, preventing emoji-related encoding errors on Windows.
 """
 
+import importlib.abc
+import importlib.util
 import os
+import re
 import sys
 
 # Add backend to path for imports
@@ -21,35 +24,68 @@ import app.core.windows_console_fix
 if sys.platform == "win32":
     os.environ["PYTHONIOENCODING"] = "utf-8"
 
-    # Monkey-patch CrewAI's FilteredStream to handle Windows encoding errors
-    # This must happen BEFORE crewai is imported by the application
-    try:
-        from crewai.llm import FilteredStream
-        _original_write = FilteredStream.write
-
-        def _safe_write(self, s):
-            """Patched write method that handles Windows encoding errors."""
-            with self._lock:
-                lower_s = s.lower()
-                # Skip noisy LiteLLM banners
-                if (
-                    "litellm.info:" in lower_s
-                    or "Consider using a smaller input or implementing a text splitting strategy" in lower_s
-                ):
-                    return 0
-                # Handle encoding errors
-                try:
+    # Monkey-patch CrewAI's FilteredStream to handle Windows encoding errors.
+    # Importing crewai here would pull in its whole dependency graph
+    # (LiteLLM, instructor, ...) before uvicorn binds, so the patch is
+    # applied by an import hook the first time the app imports crewai.llm.
+    _LITELLM_BANNER_RE = re.compile(
+        r"litellm\.info:|Consider using a smaller input or implementing a text splitting strategy",
+        re.IGNORECASE,
+    )
+
+    def _patch_filtered_stream(crewai_llm):
+        try:
+            FilteredStream = crewai_llm.FilteredStream
+
+            def _safe_write(self, s):
+                """Patched write method that drops LiteLLM banner noise."""
+                with self._lock:
+                    # Skip noisy LiteLLM banners
+                    if _LITELLM_BANNER_RE.search(s):
+                        return 0
+                    # stdout/stderr already replace unencodable characters
+                    # (app.core.windows_console_fix), so no retry is needed
                     return self._original_stream.write(s)
-                except UnicodeEncodeError:
-                    safe_s = s.encode('ascii', 'replace').decode('ascii')
-                    return self._original_stream.write(safe_s)
-
-        FilteredStream.write = _safe_write
-        print("[OK] CrewAI FilteredStream patched for Windows encoding")
-    except ImportError:
-        pass  # CrewAI not installed
-    except Exception as e:
-        print(f"[WARN] Could not patch CrewAI: {e}")
+
+            FilteredStream.write = _safe_write
+            print("[OK] CrewAI FilteredStream patched for Windows encoding")
+        except Exception as e:
+            print(f"[WARN] Could not patch CrewAI: {e}")
+
+    class _PatchingLoader(importlib.abc.Loader):
+        """Runs the real loader, then applies the patch to the new module."""
+
+        def __init__(self, loader, patch):
+            self._loader = loader
+            self._patch = patch
+
+        def create_module(self, spec):
+            return self._loader.create_module(spec)
+
+        def exec_module(self, module):
+            self._loader.exec_module(module)
+            self._patch(module)
+
+    class _PatchOnImport(importlib.abc.MetaPathFinder):
+        """One-shot finder that wraps the loader of a single module."""
+
+        def __init__(self, fullname, patch):
+            self._fullname = fullname
+            self._patch = patch
+
+        def find_spec(self, fullname, path, target=None):
+            if fullname != self._fullname:
+                return None
+            sys.meta_path.remove(self)
+            spec = importlib.util.find_spec(fullname)
+            if spec is not None and spec.loader is not None:
+                spec.loader = _PatchingLoader(spec.loader, self._patch)
+            return spec
+
+    if "crewai.llm" in sys.modules:
+        _patch_filtered_stream(sys.modules["crewai.llm"])
+    else:
+        sys.meta_path.insert(0, _PatchOnImport("crewai.llm", _patch_filtered_stream))
 
 # Now import and run uvicorn
 import uvicorn
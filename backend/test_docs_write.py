@@ -6,9 +6,17 @@ NOTE: Service accounts have storage quota limits - they can EDIT existing
 files but may not be able to CREATE new ones. Documents should be created 
 by the user (Ben) and then the service account edits them.
 """
-from googleapiclient.discovery import build
-from google.oauth2.service_account import Credentials
 import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.tools.google_clients import (
+    cached_folder_id,
+    docs_service,
+    drive_service,
+    remember_folder_id,
+)
+from app.tools.google_exec import execute_with_retry
 
 SCOPES = [
     'https://www.googleapis.com/auth/drive',
@@ -19,40 +27,44 @@ SCOPES = [
 SHARED_DRIVE_ID = '0AMpJ2pkSpYq-Uk9PVA'
 
 def main():
-    creds_path = os.path.join(os.path.dirname(__file__), 'credentials.json')
-    creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
+    creds_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'credentials.json')
     
-    drive = build('drive', 'v3', credentials=creds)
-    docs = build('docs', 'v1', credentials=creds)
+    drive = drive_service(tuple(SCOPES), creds_path)
+    docs = docs_service(tuple(SCOPES), creds_path)
     
     print("1. Finding 'Life with AI' folder in Shared Drive...")
-    results = drive.files().list(
-        q="name='Life with AI' and mimeType='application/vnd.google-apps.folder'",
-        corpora='drive',
-        driveId=SHARED_DRIVE_ID,
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True,
-        fields='files(id, name)'
-    ).execute()
+    # Resolved once and remembered between runs (see google_clients)
+    folder_id = cached_folder_id(SHARED_DRIVE_ID, 'Life with AI')
+    if folder_id is None:
+        results = execute_with_retry(drive.files().list(
+            # Top level of the drive only, matching the cache key below
+            q=f"name='Life with AI' and mimeType='application/vnd.google-apps.folder' and '{SHARED_DRIVE_ID}' in parents",
+            corpora='drive',
+            driveId=SHARED_DRIVE_ID,
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            fields='files(id, name)'
+        ))
     
-    folders = results.get('files', [])
-    if not folders:
-        print("   ERROR: Could not find folder.")
-        return
+        folders = results.get('files', [])
+        if not folders:
+            print("   ERROR: Could not find folder.")
+            return
     
-    folder_id = folders[0]['id']
+        folder_id = folders[0]['id']
+        remember_folder_id(SHARED_DRIVE_ID, 'Life with AI', folder_id)
     print(f"   Found folder ID: {folder_id}")
     
     print("\n2. Listing Google Docs in folder...")
-    docs_list = drive.files().list(
+    docs_list = execute_with_retry(drive.files().list(
         q=f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.document'",
         corpora='drive',
         driveId=SHARED_DRIVE_ID,
         includeItemsFromAllDrives=True,
         supportsAllDrives=True,
         fields='files(id, name)',
-        pageSize=10
-    ).execute()
+        pageSize=1000
+    ))
     
     doc_files = docs_list.get('files', [])
     if not doc_files:
@@ -69,17 +81,16 @@ def main():
     doc_id = test_doc['id']
     print(f"\n3. Testing READ on '{test_doc['name']}'...")
     
-    doc = docs.documents().get(documentId=doc_id).execute()
+    # Only the title and the body's end index are read below
+    doc = execute_with_retry(docs.documents().get(
+        documentId=doc_id,
+        fields='title,body(content(endIndex))'
+    ))
     title = doc.get('title', 'Untitled')
     content = doc.get('body', {}).get('content', [])
     
-    # Count characters
-    char_count = 0
-    for element in content:
-        if 'paragraph' in element:
-            for text_run in element['paragraph'].get('elements', []):
-                if 'textRun' in text_run:
-                    char_count += len(text_run['textRun'].get('content', ''))
+    # The body's last end index is its length (plus the leading section break)
+    char_count = (content[-1].get('endIndex', 1) - 1) if content else 0
     
     print(f"   Title: {title}")
     print(f"   Character count: {char_count}")
@@ -100,10 +111,10 @@ def main():
     ]
     
     try:
-        docs.documents().batchUpdate(
+        execute_with_retry(docs.documents().batchUpdate(
             documentId=doc_id,
             body={'requests': requests}
-        ).execute()
+        ), idempotent=False)
         print("   ✅ WRITE access confirmed!")
         print(f"   Appended test text to document.")
         print(f"\n🎉 SUCCESS! Full read/write access working.")
@@ -6,11 +6,32 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from dotenv import load_dotenv
 load_dotenv("../.env")
 
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+from app.tools.google_clients import FOLDER_MIME, drive_service, get_credentials
+from app.tools.google_exec import execute_with_retry
 
 SCOPES = ['https://www.googleapis.com/auth/drive', 'https://www.googleapis.com/auth/documents']
 
+DOC_MIME = 'application/vnd.google-apps.document'
+
+def list_files(service, query):
+    """Every file matching ``query`` across all drives, 1000 per page."""
+    items = []
+    page_token = None
+    while True:
+        results = execute_with_retry(service.files().list(
+            pageSize=1000,
+            fields="nextPageToken, files(id, name, mimeType)",
+            q=query,
+            corpora='allDrives',
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            pageToken=page_token
+        ))
+        items.extend(results.get('files', []))
+        page_token = results.get('nextPageToken')
+        if not page_token:
+            return items
+
 def test_drive():
     print("=" * 60)
     print("GOOGLE DRIVE - SHARED FILES TEST")
@@ -19,36 +40,26 @@ def test_drive():
     # Authenticate
     base_dir = os.path.dirname(os.path.abspath(__file__))
     creds_path = os.path.join(base_dir, "credentials.json")
-    creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
+    creds = get_credentials(tuple(SCOPES), creds_path)
     
     print(f"✅ Authenticated as: {creds.service_account_email}")
     
-    service = build('drive', 'v3', credentials=creds)
+    service = drive_service(tuple(SCOPES), creds_path)
     
-    # List ALL files the service account can see (not just in 'root')
+    # List ALL files the service account can see (not just in 'root'),
+    # letting Drive split folders from documents
     print("\n📂 Files shared with service account:")
-    results = service.files().list(
-        pageSize=30,
-        fields="files(id, name, mimeType, parents)",
-        q="trashed = false"
-    ).execute()
+    folder_items = list_files(service, f"mimeType = '{FOLDER_MIME}' and trashed = false")
+    files = list_files(service, f"mimeType = '{DOC_MIME}' and trashed = false")
     
-    items = results.get('files', [])
-    
-    if not items:
+    if not folder_items and not files:
         print("   No files found. Make sure you shared the folder with the service account email.")
         return
     
-    # Organize by folders
     folders = {}
-    files = []
-    
-    for item in items:
-        if item['mimeType'] == 'application/vnd.google-apps.folder':
-            folders[item['id']] = item['name']
-            print(f"   📁 {item['name']} (ID: {item['id']})")
-        else:
-            files.append(item)
+    for item in folder_items:
+        folders[item['id']] = item['name']
+        print(f"   📁 {item['name']} (ID: {item['id']})")
     
     print(f"\n📄 Documents found: {len(files)}")
     for item in files[:15]:  # First 15 files
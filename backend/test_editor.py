@@ -3,11 +3,32 @@ import os
 import sys
 from pathlib import Path
 import json
+import re
+import time
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from app.tools.google_exec import MAX_RETRIES, backoff_delay
 from app.tools.script_execution_tool import ScriptExecutionTool
 
+# The skill reports API failures as "ERROR: ..." text with the HttpError
+# in its stderr; these are the ones worth another try
+_RETRYABLE_OUTPUT = re.compile(r"HttpError (429|500|502|503|504)|rateLimitExceeded", re.IGNORECASE)
+
+# "Created document 'Brain Trust Test Doc' (ID: 123...)" -> the ID
+_CREATED_ID = re.compile(r"Created document .*?\(ID: ([^)\s]+)\)")
+
+# Both markers, in the order they were written, checked in one pass
+_VERIFY = re.compile(r"Initial content.*added by the editor agent", re.S)
+
+def run_with_backoff(tool, max_retries=MAX_RETRIES, **kwargs):
+    """Run the skill, backing off only when it fails with a rate limit or 5xx."""
+    for attempt in range(max_retries + 1):
+        output = tool._run(**kwargs)
+        if not (output.startswith("ERROR") and _RETRYABLE_OUTPUT.search(output)) or attempt == max_retries:
+            return output
+        time.sleep(backoff_delay(attempt))
+
 def test_story_writer():
     print("=" * 60)
     print("TESTING STORY WRITER SKILL")
@@ -27,13 +48,11 @@ def test_story_writer():
         timeout=60
     )
     
-    import time
-    
     # 1. Create Doc
     print("\n1. Creating Test Document...")
-    time.sleep(2)
     try:
-        output = tool._run(
+        output = run_with_backoff(
+            tool,
             action="create", 
             title="Brain Trust Test Doc", 
             content="Initial content from test script.",
@@ -41,12 +60,12 @@ def test_story_writer():
         )
         print(output)
         
-        # Parse ID from output: "Created document 'Brain Trust Test Doc' (ID: 123...)"
-        if "Created document" not in output:
+        match = _CREATED_ID.search(output)
+        if not match:
             print(f"❌ Failed to create document. Output: {output}")
             return
             
-        doc_id = output.split("(ID: ")[1].split(")")[0]
+        doc_id = match.group(1)
         print(f"   ✅ Doc ID: {doc_id}")
         
     except Exception as e:
@@ -55,9 +74,9 @@ def test_story_writer():
 
     # 2. Append Text
     print("\n2. Appending Text...")
-    time.sleep(2)
     try:
-        output = tool._run(
+        output = run_with_backoff(
+            tool,
             action="append",
             doc_id=doc_id,
             content="This is a new paragraph added by the editor agent."
@@ -68,15 +87,15 @@ def test_story_writer():
 
     # 3. Read Doc
     print("\n3. Reading Document...")
-    time.sleep(2)
     try:
-        content = tool._run(
+        content = run_with_backoff(
+            tool,
             action="read",
             doc_id=doc_id
         )
         print(f"--- Content Start ---\n{content}\n--- Content End ---")
         
-        if "Initial content" in content and "added by the editor agent" in content:
+        if _VERIFY.search(content):
             print("\n✅ Verification SUCCESS: All content found.")
         else:
             print("\n❌ Verification FAILED: Content missing.")
@@ -8,6 +8,8 @@ Simulates an "Editor Agent" workflow using the new skills.
 import sys
 import os
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
 # Add skills to path
 skills_path = os.path.expanduser("~/.pai/skills")
 sys.path.append(skills_path)
@@ -19,6 +21,23 @@ except ImportError as e:
     print(f"Error importing skills: {e}")
     sys.exit(1)
 
+from app.tools.google_clients import export_doc_text
+from app.tools.google_exec import execute_with_retry
+
+def list_docs(drive, folder_id):
+    """Google Docs directly in ``folder_id`` as {'id', 'name'} dicts ([] if the listing fails)."""
+    try:
+        results = execute_with_retry(drive.files().list(
+            q=f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed = false",
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            fields='files(id, name)'
+        ))
+    except Exception as e:
+        print(f"   Error listing docs: {e}")
+        return []
+    return results.get('files', [])
+
 def main():
     print("🤖 EDITOR AGENT SIMULATION STARTING...\n")
     
@@ -30,47 +49,42 @@ def main():
     from googleapiclient.discovery import build
     from google.oauth2.service_account import Credentials
     
-    # We can use story_writer's service getter if we want, but let's trust the search for now.
-    # Let's try to list using the skill first.
-    output = story_writer.list_docs(folder_id)
-    if "Error" in output or "No Google Docs" in output:
+    drive, _, _ = story_writer.get_services()
+    
+    # Work with the listing as data rather than parsing list_docs' text output
+    docs = list_docs(drive, folder_id)
+    if not docs:
         # Fallback: search for the folder again to get fresh ID
         print("   Re-acquiring folder ID...")
-        drive, _, _ = story_writer.get_services()
-        results = drive.files().list(
+        results = execute_with_retry(drive.files().list(
             q="name='Life with AI' and mimeType='application/vnd.google-apps.folder'",
+            corpora='allDrives',
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
             fields='files(id)'
-        ).execute()
+        ))
         files = results.get('files', [])
         if not files:
             print("❌ Critical: 'Life with AI' folder not found.")
             return
         folder_id = files[0]['id']
         print(f"   Found Folder ID: {folder_id}")
-        output = story_writer.list_docs(folder_id)
-
-    print(output)
-    
-    # Parse the first doc ID from output (simple parsing)
-    lines = output.splitlines()
-    doc_id = None
-    doc_name = None
+        docs = list_docs(drive, folder_id)
     
-    for i, line in enumerate(lines):
-        if "ID:" in line:
-            doc_id = line.split("ID:")[1].strip()
-            doc_name = lines[i-1].strip('- ')
-            break
-            
-    if not doc_id:
+    if not docs:
         print("❌ No documents found to test.")
         return
+    
+    for doc in docs:
+        print(f"   - {doc['name']} (ID: {doc['id']})")
+    doc_id, doc_name = docs[0]['id'], docs[0]['name']
         
     print(f"✅ Target selected: '{doc_name}' ({doc_id})")
     
     # 2. Read content
     print(f"\n2. Reading document...")
-    content = story_writer.read_doc(doc_id)
+    # Plain-text export: the style check only needs the text
+    content = export_doc_text(drive, doc_id)
     print(f"   Read {len(content)} characters.")
     
     # 3. Check style
@@ -5,11 +5,15 @@ Simulates the Editorial Crew workflow to verify toolchain and prompt integration
 Input: Doc ID + Topic
 Output: Populated Google Doc with Draft, Edits, and Report.
 """
+import functools
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
 # Add skills to path
 skills_path = os.path.expanduser("~/.pai/skills")
 sys.path.append(skills_path)
@@ -21,10 +25,16 @@ except ImportError:
     print("Skills not found in ~/.pai/skills")
     sys.exit(1)
 
+from app.tools.google_clients import export_doc_text
+
 # Load Environment
 env_path = os.path.join(os.path.dirname(__file__), ".env")
 load_dotenv(env_path)
 
+ROLES = ("scribe", "editor", "guardian")
+
+# Read once per process, however many workflows run
+@functools.lru_cache(maxsize=16)
 def load_prompt(role):
     path = os.path.expanduser(f"~/.pai/prompts/{role}.md")
     if os.path.exists(path):
@@ -36,9 +46,21 @@ def simulate_workflow(doc_id, topic):
     print(f"🎬 Director: Starting interaction for '{topic}'...")
     print(f"   Target Doc: https://docs.google.com/document/d/{doc_id}")
 
+    # Read the doc once; each agent's output is kept locally and the three
+    # sections go out in a single append at the end instead of an
+    # append/re-read round trip per agent. The personas don't depend on
+    # the doc, so they load while the read is in flight.
+    with ThreadPoolExecutor(max_workers=len(ROLES) + 1) as executor:
+        drive, _, _ = story_writer.get_services()
+        doc_future = executor.submit(export_doc_text, drive, doc_id)
+        prompts = dict(zip(ROLES, executor.map(load_prompt, ROLES)))
+        current_content = doc_future.result()
+    # Text before this offset was in the doc already and isn't re-checked
+    checked_upto = len(current_content)
+
     # --- SCRIBE ---
     print("\n✍️  SCRIBE (Agent) activating...")
-    prompt = load_prompt("scribe")
+    prompt = prompts["scribe"]
     print(f"   Loaded Persona: {len(prompt)} chars")
     
     # Simulate LLM Generation
@@ -55,17 +77,13 @@ The humans were not masters, and it was not a slave. They were two halves of a w
 """
     print("   Generating draft...")
     time.sleep(1)
-    print("   Appending to doc...")
-    story_writer.append_text(doc_id, draft_content)
+    current_content += draft_content
 
     # --- EDITOR ---
     print("\n🧐 EDITOR (Agent) activating...")
-    prompt = load_prompt("editor")
+    prompt = prompts["editor"]
     print(f"   Loaded Persona: {len(prompt)} chars")
     
-    # Read what Scribe wrote
-    current_content = story_writer.read_doc(doc_id)
-    
     # Simulate Editorial Logic
     notes = """
 ## Editorial Notes
@@ -75,17 +93,15 @@ The humans were not masters, and it was not a slave. They were two halves of a w
 
 [Reviewed by: The Editor (Simulation)]
 """
-    print("   Appending notes...")
-    story_writer.append_text(doc_id, notes)
+    current_content += notes
 
     # --- GUARDIAN ---
     print("\n🛡️  GUARDIAN (Agent) activating...")
-    prompt = load_prompt("guardian")
+    prompt = prompts["guardian"]
     print(f"   Loaded Persona: {len(prompt)} chars")
     
-    # Check Compliance on full text
-    full_text = story_writer.read_doc(doc_id)
-    report = style_checking.check_text(full_text)
+    # Check Compliance on this pass's draft and notes only
+    report = style_checking.check_text(current_content[checked_upto:])
     
     compliance_section = f"""
 ## Compliance Report
@@ -93,8 +109,8 @@ The humans were not masters, and it was not a slave. They were two halves of a w
 
 [Checked by: The Guardian (Simulation)]
 """
-    print("   Appending report...")
-    story_writer.append_text(doc_id, compliance_section)
+    print("\n📝 Appending draft, notes and report to doc...")
+    story_writer.append_text(doc_id, draft_content + notes + compliance_section)
 
     print("\n✅ WORKFLOW COMPLETE.")
     print("   The Editorial Team has finished their pass.")
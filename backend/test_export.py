@@ -2,10 +2,10 @@
 import os
 import sys
 from pathlib import Path
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
-import io
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.tools.google_clients import drive_service
+from app.tools.google_exec import execute_with_retry
 
 SCOPES = ['https://www.googleapis.com/auth/drive']
 
@@ -13,15 +13,17 @@ def test_export():
     base_dir = Path.home() / ".pai" / "skills"
     creds_path = base_dir / "credentials.json"
     
-    creds = service_account.Credentials.from_service_account_file(str(creds_path), scopes=SCOPES)
-    service = build('drive', 'v3', credentials=creds)
+    service = drive_service(tuple(SCOPES), str(creds_path))
     
     # Try to find ANY google doc
-    results = service.files().list(
+    results = execute_with_retry(service.files().list(
         q="mimeType = 'application/vnd.google-apps.document' and trashed = false",
         pageSize=1,
+        corpora='allDrives',
+        includeItemsFromAllDrives=True,
+        supportsAllDrives=True,
         fields="files(id, name)"
-    ).execute()
+    ))
     
     files = results.get('files', [])
     if not files:
@@ -33,16 +35,11 @@ def test_export():
     print("Attempting export as text/plain...")
     
     try:
-        request = service.files().export_media(fileId=doc['id'], mimeType='text/plain')
-        file_content = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_content, request)
-        
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-            
+        # Exports are capped at 10 MB, so one GET fetches the whole file
+        content = execute_with_retry(service.files().export_media(fileId=doc['id'], mimeType='text/plain'))
+
         print("✅ Export successful!")
-        print(f"Content preview: {file_content.getvalue()[:100]}")
+        print(f"Content preview: {content[:100]}")
     except Exception as e:
         print(f"❌ Export failed: {e}")
 
@@ -0,0 +1,105 @@
+"""
+Unit tests for the Google API retry helpers in app.tools.google_exec.
+
+Run with:
+    pytest backend/test_google_exec_pytest.py -v
+"""
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from googleapiclient.errors import HttpError
+
+from app.tools import google_exec
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeResponse(dict):
+    """Just enough of an httplib2.Response for HttpError."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(headers or {})
+        self.status = status
+        self.reason = "test"
+
+
+def http_error(status, content=b"", headers=None):
+    return HttpError(FakeResponse(status, headers), content)
+
+
+class StubRequest:
+    """Raises the queued errors in turn, then returns ``result``."""
+
+    def __init__(self, errors, result="ok"):
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff waits instead of sleeping."""
+    waits = []
+    monkeypatch.setattr(google_exec.time, "sleep", waits.append)
+    return waits
+
+
+class TestIsRetryable:
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_rate_limits_and_5xx(self, status):
+        assert google_exec.is_retryable(http_error(status))
+
+    def test_rate_limit_403(self):
+        error = http_error(403, b'{"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}')
+        assert google_exec.is_retryable(error)
+        assert google_exec.is_retryable(error, idempotent=False)
+
+    @pytest.mark.parametrize("status", [400, 401, 403, 404])
+    def test_client_errors(self, status):
+        assert not google_exec.is_retryable(http_error(status, b"insufficientPermissions"))
+
+    def test_writes_skip_5xx(self):
+        assert not google_exec.is_retryable(http_error(503), idempotent=False)
+        assert google_exec.is_retryable(http_error(429), idempotent=False)
+
+
+class TestExecuteWithRetry:
+
+    def test_retries_until_success(self, sleeps):
+        request = StubRequest([http_error(503), http_error(429)])
+        assert google_exec.execute_with_retry(request) == "ok"
+        assert request.calls == 3
+        assert len(sleeps) == 2
+
+    def test_gives_up_after_max_retries(self, sleeps):
+        request = StubRequest([http_error(500)] * 5)
+        with pytest.raises(HttpError):
+            google_exec.execute_with_retry(request, max_retries=2)
+        assert request.calls == 3
+
+    def test_non_retryable_raises_at_once(self, sleeps):
+        request = StubRequest([http_error(404)])
+        with pytest.raises(HttpError):
+            google_exec.execute_with_retry(request)
+        assert request.calls == 1
+        assert sleeps == []
+
+    def test_write_not_retried_on_5xx(self, sleeps):
+        request = StubRequest([http_error(500)])
+        with pytest.raises(HttpError):
+            google_exec.execute_with_retry(request, idempotent=False)
+        assert request.calls == 1
+
+    def test_retry_after_is_capped(self, sleeps):
+        request = StubRequest([http_error(429, headers={"retry-after": "600"})])
+        assert google_exec.execute_with_retry(request) == "ok"
+        assert sleeps == [google_exec.MAX_BACKOFF]
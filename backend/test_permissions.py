@@ -2,10 +2,12 @@
 import os
 import sys
 import traceback
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
 from googleapiclient.errors import HttpError
 
+from app.tools import google_clients
+
 SCOPES = ['https://www.googleapis.com/auth/documents', 'https://www.googleapis.com/auth/drive']
 TARGET_FOLDER_ID = '1fKYixOC9aDcm-XHAIHhfGj3rKlRg5b-i' # 02_In_Development
 
@@ -17,9 +19,9 @@ def test_permissions():
     print(f"Target Folder: {TARGET_FOLDER_ID}")
     
     try:
-        creds = service_account.Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-        docs_service = build('docs', 'v1', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
+        # Built from the discovery documents bundled with the client library
+        docs_service = google_clients.docs_service(tuple(SCOPES), creds_path)
+        drive_service = google_clients.drive_service(tuple(SCOPES), creds_path)
         
         print("\nAttempting to create doc in Shared Folder...")
         
@@ -49,7 +51,7 @@ def test_permissions():
                 fileId=doc_id,
                 addParents=TARGET_FOLDER_ID,
                 removeParents=previous_parents,
-                fields='id, parents'
+                fields='id'
             ).execute()
             print("   ✅ Move Success! Folder permissions are good.")
             
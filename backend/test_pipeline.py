@@ -16,6 +16,9 @@ import time
 API_KEY = os.getenv("BRAIN_TRUST_API_KEY")
 BASE_URL = "http://127.0.0.1:8000"
 
+# One pooled, keep-alive connection to the backend for every request
+SESSION = requests.Session()
+
 # Sample story beat for testing
 SAMPLE_STORY_BEAT = """
 STORY: "The Interview"
@@ -36,7 +39,7 @@ TARGET LENGTH: 1500-2000 words
 """
 
 def test_editorial_pipeline():
-    """Test the editorial pipeline with sequential agents."""
+    """Test the editorial pipeline, with independent agents running in parallel."""
     headers = {
         "Content-Type": "application/json",
         "X-API-Key": API_KEY
@@ -93,11 +96,47 @@ Do NOT change the story content or structure.
 Output the fully polished story.""",
                     "model": "gemini-2.0-flash"
                 }
+            },
+            {
+                "id": "fact-checker",
+                "type": "agentNode",
+                "position": {"x": 700, "y": 300},
+                "data": {
+                    "name": "Fact Checker",
+                    "role": "Continuity and Plausibility Checker",
+                    "goal": "Check the revised draft against the story beats and near-future plausibility. List every issue found with a suggested fix.",
+                    "backstory": """You are a careful fact checker for near-future fiction.
+Confirm every story beat is present and in order.
+Flag technology or details that are implausible for 2028.
+Flag continuity errors in names, places, and timeline.
+Do NOT rewrite the story. Output a list of issues and fixes.""",
+                    "model": "gemini-2.0-flash"
+                }
+            },
+            {
+                "id": "final-reviewer",
+                "type": "agentNode",
+                "position": {"x": 1000, "y": 200},
+                "data": {
+                    "name": "Final Reviewer",
+                    "role": "Managing Editor",
+                    "goal": "Merge the polished story with the fact check. Apply every valid fix and output the final version of the story.",
+                    "backstory": """You are the managing editor who signs off on every story.
+Start from the copy editor's polished version.
+Apply the fact checker's fixes without undoing the polish.
+Output only the final story.""",
+                    "model": "gemini-2.0-flash"
+                }
             }
         ],
+        # Copy edit and fact check only depend on the dev edit, so they run
+        # side by side; the final review waits for both
         "edges": [
             {"id": "e1", "source": "draft-agent", "target": "dev-editor"},
-            {"id": "e2", "source": "dev-editor", "target": "copy-editor"}
+            {"id": "e2", "source": "dev-editor", "target": "copy-editor"},
+            {"id": "e3", "source": "dev-editor", "target": "fact-checker"},
+            {"id": "e4", "source": "copy-editor", "target": "final-reviewer"},
+            {"id": "e5", "source": "fact-checker", "target": "final-reviewer"}
         ]
     }
     
@@ -105,13 +144,13 @@ Output the fully polished story.""",
     print("EDITORIAL PIPELINE TEST")
     print("=" * 70)
     print(f"\nStory: 'The Interview'")
-    print(f"Pipeline: Draft → Dev Edit → Copy Edit")
+    print(f"Pipeline: Draft → Dev Edit → (Copy Edit | Fact Check) → Final Review")
     print(f"\nSending workflow...")
     
     start = time.time()
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/v1/run-workflow",
             headers=headers,
             json=workflow,